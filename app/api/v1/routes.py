@@ -2,9 +2,16 @@ from fastapi import APIRouter
 from app.api.v1.sydney import routes as sydney_routes
 from app.services.redis_service import RedisService
 from typing import Dict
+import asyncio
+import time
 
 router = APIRouter()
 
+# Memoized health result so frequent probes don't each ping Redis
+HEALTH_CACHE_TTL = 1.0
+_HEALTH_CACHE = {"ts": 0.0, "val": None}
+_health_lock = asyncio.Lock()
+
 @router.get("/health", tags=["health"])
 async def health_check() -> Dict[str, str]:
     """
@@ -13,16 +20,28 @@ async def health_check() -> Dict[str, str]:
     Returns:
         Dict containing health status of the service and Redis
     """
-    # Check Redis health
-    redis_health = await RedisService.check_health()
-    
-    # Overall status is healthy only if Redis is also healthy
-    status = "healthy" if redis_health["status"] == "healthy" else "unhealthy"
+    if time.monotonic() - _HEALTH_CACHE["ts"] < HEALTH_CACHE_TTL and _HEALTH_CACHE["val"]:
+        return _HEALTH_CACHE["val"]
     
-    return {
-        "status": status,
-        "redis": redis_health["message"]
-    }
+    async with _health_lock:
+        # Another probe may have refreshed the result while we waited
+        now = time.monotonic()
+        if now - _HEALTH_CACHE["ts"] < HEALTH_CACHE_TTL and _HEALTH_CACHE["val"]:
+            return _HEALTH_CACHE["val"]
+        
+        # Check Redis health
+        redis_health = await RedisService.check_health()
+        
+        # Overall status is healthy only if Redis is also healthy
+        status = "healthy" if redis_health["status"] == "healthy" else "unhealthy"
+        
+        result = {
+            "status": status,
+            "redis": redis_health["message"]
+        }
+        _HEALTH_CACHE["ts"] = now
+        _HEALTH_CACHE["val"] = result
+        return result
 
 # Include city-specific routes
 router.include_router(sydney_routes.router) 
\ No newline at end of file
@@ -1,37 +1,64 @@
-from fastapi import APIRouter, HTTPException
-from app.services.redis_service import RedisService
+from fastapi import APIRouter, Depends, HTTPException
+from redis.asyncio import Redis
+from app.core.deps import get_redis, get_tfnsw_service
+from app.services.tfnsw_service import TfnswService
+from app.services.station_translation_service import get_translation_service
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Maximum number of keys removed by a single UNLINK command
+KEY_DEL_CHUNK_SIZE = 512
+
+async def _unlink_keys(redis, keys: list) -> int:
+    """Unlink a chunk of keys in one pipelined round-trip and return how many were removed"""
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.unlink(*keys)
+        results = await pipe.execute()
+    return sum(results)
+
 @router.post("/clear-translation-cache", 
             summary="Clear Sydney Station Name Translation Cache",
             description="Clear all station name translation cache stored in Redis for Sydney")
-async def clear_translation_cache():
+async def clear_translation_cache(
+    redis: Redis = Depends(get_redis),
+    tfnsw_service: TfnswService = Depends(get_tfnsw_service)
+):
     """
     Clear all station name translation cache stored in Redis for Sydney.
     This operation will delete all cache keys with prefix 'station_translation:'.
+    Keys are scanned incrementally and unlinked in chunks so Redis is never blocked.
+    This worker's in-process translation and raw trip caches are dropped as well.
     """
     try:
-        redis = await RedisService.get_redis()
         if not redis:
             raise HTTPException(status_code=503, detail="Redis service not connected")
             
-        # Use pattern matching to delete all translation cache
+        # Drop this worker's in-process copies too, so cleared entries are not served locally
+        get_translation_service().clear_local_cache()
+        tfnsw_service.clear_trip_cache()
+        
+        # Iterate matching keys with SCAN instead of a blocking KEYS call
         pattern = "station_translation:*"
-        keys = await redis.keys(pattern)
+        deleted_count = 0
+        chunk = []
+        async for key in redis.scan_iter(match=pattern, count=1000):
+            chunk.append(key)
+            if len(chunk) >= KEY_DEL_CHUNK_SIZE:
+                deleted_count += await _unlink_keys(redis, chunk)
+                chunk = []
         
-        if not keys:
+        if chunk:
+            deleted_count += await _unlink_keys(redis, chunk)
+        
+        if not deleted_count:
             return {"message": "No translation cache found to clear"}
-            
-        # Batch delete matching keys
-        await redis.delete(*keys)
         
-        logger.info(f"Successfully cleared {len(keys)} translation cache entries")
+        logger.info(f"Successfully cleared {deleted_count} translation cache entries")
         return {
-            "message": f"Successfully cleared {len(keys)} translation cache entries",
-            "cleared_keys_count": len(keys)
+            "message": f"Successfully cleared {deleted_count} translation cache entries",
+            "cleared_keys_count": deleted_count
         }
         
     except Exception as e:
@@ -1,21 +1,76 @@
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import ORJSONResponse
 from typing import Dict, Any, Optional, List
 from app.services.tfnsw_service import TfnswService
-from app.core.deps import get_tfnsw_service
+from redis.asyncio import Redis
+from app.core.deps import get_redis, get_tfnsw_service
+from app.utils.date_utils import SYDNEY_TIMEZONE
+import asyncio
+import hashlib
 import httpx
 import logging
+import orjson
 from datetime import datetime
-import pytz
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-# Set Sydney timezone
-SYDNEY_TIMEZONE = pytz.timezone('Australia/Sydney')
+# Today's Sydney date formatted for the add_info filter, refreshed when the day changes
+_date_cache = {"day": None, "str": None}
 
-async def get_stop_id(tfnsw_service: TfnswService, location: str) -> Optional[str]:
+# Fixed query parameters for the stop_finder and add_info endpoints
+_STOP_FINDER_PARAMS_BASE = {
+    "outputFormat": "rapidJSON",
+    "type_sf": "any",  # Name search, stops are picked out of the results below
+    "version": "10.2.1.42"
+}
+_ADD_INFO_PARAMS_BASE = {
+    "outputFormat": "rapidJSON",
+    "coordOutputFormat": "EPSG:4326",
+    "filterPublicationStatus": "current",
+    "version": "10.2.1.42"
+}
+
+# Stop name -> stop ID mappings are effectively static, cache them for a day
+STOP_ID_CACHE_PREFIX = "stop_id:v1:"
+STOP_ID_CACHE_TTL = 86400
+
+async def get_stop_id(tfnsw_service: TfnswService, redis: Optional[Redis], location: str) -> Optional[str]:
+    """
+    Get stop ID from stop name, using Redis as a cache in front of the stop finder
+    
+    Args:
+        tfnsw_service: TFNSW service instance
+        redis: Shared Redis client, or None to skip the cache
+        location: Stop name
+        
+    Returns:
+        Stop ID or None
+    """
+    cache_key = f"{STOP_ID_CACHE_PREFIX}{hashlib.sha1(location.lower().encode('utf-8')).hexdigest()}"
+    if redis:
+        try:
+            cached_stop_id = await redis.get(cache_key)
+            if cached_stop_id:
+                logger.debug(f"Stop ID cache hit for: {location}")
+                return cached_stop_id
+        except Exception as e:
+            # Redis outages degrade to direct upstream lookups
+            logger.warning(f"Error reading stop ID from Redis cache: {str(e)}")
+    
+    stop_id = await fetch_stop_id(tfnsw_service, location)
+    
+    if stop_id and redis:
+        try:
+            await redis.set(cache_key, stop_id, ex=STOP_ID_CACHE_TTL)
+        except Exception as e:
+            logger.warning(f"Error writing stop ID to Redis cache: {str(e)}")
+    
+    return stop_id
+
+async def fetch_stop_id(tfnsw_service: TfnswService, location: str) -> Optional[str]:
     """
-    Get stop ID from stop name
+    Get stop ID from stop name via the TfNSW stop finder
     
     Args:
         tfnsw_service: TFNSW service instance
@@ -25,31 +80,23 @@ async def get_stop_id(tfnsw_service: TfnswService, location: str) -> Optional[st
         Stop ID or None
     """
     try:
-        params = {
-            "outputFormat": "rapidJSON",
-            "type_sf": "any",
-            "name_sf": location,
-            "version": "10.2.1.42"
-        }
+        params = {**_STOP_FINDER_PARAMS_BASE, "name_sf": location}
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{tfnsw_service.base_url}/stop_finder",
-                headers=tfnsw_service.headers,
-                params=params
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            # Find first stop result
-            if "locations" in data and data["locations"]:
-                for location in data["locations"]:
-                    if location.get("type") == "stop":
-                        return location.get("id")
-            
+        # Reuse the service's pooled client, which already carries the auth headers
+        response = await tfnsw_service.client.get(
+            "/stop_finder",
+            params=params
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        
+        # Use the first stop result
+        locations = data.get("locations") or []
+        stop_id = next((loc.get("id") for loc in locations if loc.get("type") == "stop"), None)
+        if stop_id is None:
             logger.warning(f"Stop ID not found: {location}")
-            return None
-            
+        return stop_id
+        
     except Exception as e:
         logger.error(f"Failed to get stop ID: {str(e)}")
         return None
@@ -58,7 +105,8 @@ async def get_stop_id(tfnsw_service: TfnswService, location: str) -> Optional[st
 async def get_service_alerts(
     from_location: str,
     to_location: str,
-    tfnsw_service: TfnswService = Depends(get_tfnsw_service)
+    tfnsw_service: TfnswService = Depends(get_tfnsw_service),
+    redis: Redis = Depends(get_redis)
 ) -> List[Dict[str, Any]]:
     """
     Get service alerts between two stops for today
@@ -71,9 +119,11 @@ async def get_service_alerts(
         List of service alerts
     """
     try:
-        # Get stop IDs
-        from_stop_id = await get_stop_id(tfnsw_service, from_location)
-        to_stop_id = await get_stop_id(tfnsw_service, to_location)
+        # Get stop IDs, resolving both stops concurrently
+        from_stop_id, to_stop_id = await asyncio.gather(
+            get_stop_id(tfnsw_service, redis, from_location),
+            get_stop_id(tfnsw_service, redis, to_location)
+        )
         
         if not from_stop_id or not to_stop_id:
             raise HTTPException(
@@ -82,71 +132,73 @@ async def get_service_alerts(
             )
         
         # Get today's date in Sydney timezone
-        today = datetime.now(SYDNEY_TIMEZONE)
-        date_str = today.strftime("%d-%m-%Y")
+        today = datetime.now(SYDNEY_TIMEZONE).date()
+        if today != _date_cache["day"]:
+            _date_cache["day"] = today
+            _date_cache["str"] = today.strftime("%d-%m-%Y")
+        date_str = _date_cache["str"]
         
         # Build request parameters
         params = {
-            "outputFormat": "rapidJSON",
-            "coordOutputFormat": "EPSG:4326",
+            **_ADD_INFO_PARAMS_BASE,
             "filterDateValid": date_str,
-            "filterPublicationStatus": "current",
-            "itdLPxx_selStop": f"{from_stop_id},{to_stop_id}",
-            "version": "10.2.1.42"
+            "itdLPxx_selStop": f"{from_stop_id},{to_stop_id}"
         }
         
         # Call TFNSW API to get service alerts
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{tfnsw_service.base_url}/add_info",
-                headers=tfnsw_service.headers,
-                params=params
-            )
-            
-            if response.status_code == 401:
-                raise HTTPException(status_code=401, detail="Authentication failed. Please check API key")
-            elif response.status_code == 403:
-                raise HTTPException(status_code=403, detail="Access forbidden. API key may not have required permissions")
-            
-            # Return empty list if no alerts found
-            if response.status_code == 404:
-                logger.info(f"No service alerts found between {from_location} and {to_location}")
-                return []
-            
-            response.raise_for_status()
-            response_data = response.json()
-            
-            # Format response data - only return current alerts
-            alerts = response_data.get("infos", {}).get("current", [])
-            
-            # Simplify alert data
-            simplified_alerts = []
-            for alert in alerts:
-                simplified_alert = {
-                    "id": alert.get("id"),
-                    "priority": alert.get("priority"),
-                    "title": alert.get("subtitle"),
-                    "content": alert.get("content"),
-                    "affected_stops": [
-                        {
-                            "id": stop.get("id"),
-                            "name": stop.get("name")
-                        }
-                        for stop in alert.get("affected", {}).get("stops", [])
-                    ],
-                    "affected_lines": [
-                        {
-                            "id": line.get("id"),
-                            "name": line.get("name"),
-                            "number": line.get("number")
-                        }
-                        for line in alert.get("affected", {}).get("lines", [])
-                    ]
-                }
-                simplified_alerts.append(simplified_alert)
-            
-            return simplified_alerts
-            
+        response = await tfnsw_service.client.get(
+            "/add_info",
+            params=params
+        )
+        
+        if response.status_code == 401:
+            raise HTTPException(status_code=401, detail="Authentication failed. Please check API key")
+        elif response.status_code == 403:
+            raise HTTPException(status_code=403, detail="Access forbidden. API key may not have required permissions")
+        
+        # Return empty list if no alerts found
+        if response.status_code == 404:
+            logger.info(f"No service alerts found between {from_location} and {to_location}")
+            return []
+        
+        response.raise_for_status()
+        response_data = orjson.loads(response.content)
+        
+        # Format response data - only return current alerts
+        alerts = response_data.get("infos", {}).get("current", [])
+        
+        # Simplify alert data ("for affected in [...]" binds the affected block once per alert)
+        simplified_alerts = [
+            {
+                "id": alert.get("id"),
+                "priority": alert.get("priority"),
+                "title": alert.get("subtitle"),
+                "content": alert.get("content"),
+                "affected_stops": [
+                    {
+                        "id": stop.get("id"),
+                        "name": stop.get("name")
+                    }
+                    for stop in affected.get("stops", ())
+                ],
+                "affected_lines": [
+                    {
+                        "id": line.get("id"),
+                        "name": line.get("name"),
+                        "number": line.get("number")
+                    }
+                    for line in affected.get("lines", ())
+                ]
+            }
+            for alert in alerts
+            for affected in [alert.get("affected") or {}]
+        ]
+        
+        # Alerts are already plain dicts, serialize them directly
+        return ORJSONResponse(simplified_alerts)
+        
+    except HTTPException:
+        raise
     except httpx.HTTPError as e:
         logger.error(f"HTTP request failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"HTTP request failed: {str(e)}")
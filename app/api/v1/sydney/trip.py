@@ -1,10 +1,13 @@
 import logging
-from typing import Dict, Any, Optional
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.exceptions import ResponseValidationError
+from fastapi.responses import Response, StreamingResponse
+from pydantic import ValidationError
 
 from app.core.deps import get_tfnsw_service
 from app.services.tfnsw_service import TfnswService
-from app.models.trip import TripRequest, TripResponse
+from app.models.trip import JOURNEY_ADAPTER, TRIP_RESPONSE_ADAPTER, TripRequest, TripResponse
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -16,7 +19,7 @@ async def get_trip_plan(
     departure_time: Optional[str] = None,
     language_code: str = "en",
     tfnsw_service: TfnswService = Depends(get_tfnsw_service)
-) -> Dict[str, Any]:
+) -> Response:
     """
     Get trip planning information between two locations
     
@@ -32,13 +35,12 @@ async def get_trip_plan(
     try:
         logger.info(f"Received trip plan request: from {from_location} to {to_location}, time: {departure_time or 'now'}, language: {language_code}")
         
-        # Validate request
+        # Validate request (a malformed departure_time is reported as 400 with the validator's message below)
         trip_request = TripRequest(
             from_location=from_location,
             to_location=to_location,
             departure_time=departure_time
         )
-        trip_request.validate_request()
         logger.debug("Request validation successful")
         
         # Get trip plan
@@ -52,11 +54,83 @@ async def get_trip_plan(
         formatted_response = await tfnsw_service.format_trip_response(response, language_code)
         logger.info(f"Found {len(formatted_response['journeys'])} possible journeys")
         
-        return formatted_response
+    except ValidationError as e:
+        # Report the validator's own message rather than pydantic's full error dump
+        detail = str(e.errors()[0].get("ctx", {}).get("error", e))
+        logger.error(f"Request validation failed: {detail}")
+        raise HTTPException(status_code=400, detail=detail)
+    except ValueError as e:
+        logger.error(f"Request validation failed: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to get trip plan: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to get trip plan: {str(e)}") 
+    
+    # Validate and serialize in one pass with the prebuilt adapter (legs are dataclasses, read by attribute),
+    # response_model is kept for the OpenAPI schema. This stays outside the try above: a response that fails
+    # the model is a server error (FastAPI's ResponseValidationError, 500), not a bad request.
+    try:
+        trip_response = TRIP_RESPONSE_ADAPTER.validate_python(formatted_response, from_attributes=True)
+    except ValidationError as e:
+        raise ResponseValidationError(errors=e.errors(), body=formatted_response)
+    return Response(
+        content=TRIP_RESPONSE_ADAPTER.dump_json(trip_response),
+        media_type="application/json"
+    )
+
+@router.get("/trip/stream", response_class=StreamingResponse)
+async def stream_trip_plan(
+    from_location: str,
+    to_location: str,
+    departure_time: Optional[str] = None,
+    language_code: str = "en",
+    tfnsw_service: TfnswService = Depends(get_tfnsw_service)
+) -> StreamingResponse:
+    """
+    Get trip planning information between two locations as newline-delimited JSON
+    
+    Each line is one journey in the same shape as the /trip response, written as it is formatted.
+    
+    Args:
+        from_location: Starting location (stop name or ID)
+        to_location: Destination location (stop name or ID)
+        departure_time: Optional departure time in ISO format
+        language_code: Language code for station name translations (default: "en")
+        
+    Returns:
+        Streaming NDJSON response, one journey per line
+    """
+    try:
+        logger.info(f"Received trip stream request: from {from_location} to {to_location}, time: {departure_time or 'now'}, language: {language_code}")
+        
+        trip_request = TripRequest(
+            from_location=from_location,
+            to_location=to_location,
+            departure_time=departure_time
+        )
+        
+        response = await tfnsw_service.get_trip_plan(
+            trip_request.from_location,
+            trip_request.to_location,
+            trip_request.departure_time
+        )
+        
+        # Upstream and translation errors are raised here, before the response starts
+        journeys = await tfnsw_service.stream_trip_response(response, language_code)
+        
+        return StreamingResponse(
+            (JOURNEY_ADAPTER.dump_json(JOURNEY_ADAPTER.validate_python(journey, from_attributes=True)) + b"\n" for journey in journeys),
+            media_type="application/x-ndjson"
+        )
         
+    except ValidationError as e:
+        # Report the validator's own message rather than pydantic's full error dump
+        detail = str(e.errors()[0].get("ctx", {}).get("error", e))
+        logger.error(f"Request validation failed: {detail}")
+        raise HTTPException(status_code=400, detail=detail)
     except ValueError as e:
         logger.error(f"Request validation failed: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to get trip plan: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to get trip plan: {str(e)}") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Failed to get trip plan: {str(e)}")
\ No newline at end of file
@@ -1,10 +1,21 @@
+from fastapi import Request
+from redis.asyncio import Redis
 from app.services.tfnsw_service import TfnswService
 
-def get_tfnsw_service() -> TfnswService:
+def get_tfnsw_service(request: Request) -> TfnswService:
     """
-    Get TFNSW service instance
+    Get the shared TFNSW service instance created at application startup
     
     Returns:
         TfnswService: TFNSW service instance
     """
-    return TfnswService() 
\ No newline at end of file
+    return request.app.state.tfnsw_service
+
+def get_redis(request: Request) -> Redis:
+    """
+    Get the shared Redis client created at application startup
+    
+    Returns:
+        Redis: Async Redis client
+    """
+    return request.app.state.redis
\ No newline at end of file
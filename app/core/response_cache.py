@@ -0,0 +1,86 @@
+import logging
+from typing import Optional
+from urllib.parse import urlencode
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+logger = logging.getLogger(__name__)
+
+# Cache lifetime in seconds for cacheable GET endpoints, matched on the full mounted path
+CACHE_TTL_BY_PATH = {
+    "/api/v1/sydney/trip": 30,     # Short TTL - departure times move
+    "/api/v1/sydney/alerts": 120,
+}
+
+class ResponseCacheMiddleware(BaseHTTPMiddleware):
+    """
+    Cache successful GET responses in Redis so repeated queries skip the upstream TfNSW calls.
+    Entries are shared across worker processes and keyed on the path plus the full query string.
+    """
+
+    def __init__(self, app, cache_prefix: str = "response_cache:v1:"):
+        super().__init__(app)
+        self.cache_prefix = cache_prefix
+
+    def _get_ttl(self, request: Request) -> Optional[int]:
+        """Get the cache TTL for a request, or None if it should not be cached"""
+        if request.method != "GET":
+            return None
+        # Match the route path, without the app's root_path if the server included it
+        path = request.scope["path"]
+        root_path = request.scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):]
+        return CACHE_TTL_BY_PATH.get(path)
+
+    def _get_cache_key(self, request: Request) -> str:
+        """Build the cache key from the path and the sorted query parameters"""
+        query = urlencode(sorted(request.query_params.multi_items()))
+        return f"{self.cache_prefix}{request.url.path}?{query}"
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        ttl = self._get_ttl(request)
+        if ttl is None:
+            return await call_next(request)
+
+        cache_control = f"public, max-age={ttl}"
+        cache_key = self._get_cache_key(request)
+
+        # Shared client created at startup, as provided to routes by app.core.deps.get_redis
+        redis = getattr(request.app.state, "redis", None)
+        if redis is not None:
+            try:
+                cached_body = await redis.get(cache_key)
+                if cached_body is not None:
+                    logger.debug(f"Response cache hit for: {cache_key}")
+                    return Response(
+                        content=cached_body,
+                        media_type="application/json",
+                        headers={"Cache-Control": cache_control, "X-Cache": "HIT"}
+                    )
+            except Exception as e:
+                # Serve the request uncached if Redis is unavailable
+                logger.warning(f"Error reading from response cache: {str(e)}")
+
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        if redis is not None:
+            try:
+                await redis.set(cache_key, body, ex=ttl)
+            except Exception as e:
+                logger.warning(f"Error writing to response cache: {str(e)}")
+
+        cached_response = Response(
+            content=body,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            media_type=response.media_type
+        )
+        cached_response.headers["Cache-Control"] = cache_control
+        cached_response.headers["X-Cache"] = "MISS"
+        return cached_response
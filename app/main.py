@@ -1,26 +1,40 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from redis.asyncio import Redis
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 from app.core.config import settings
+from app.core.response_cache import ResponseCacheMiddleware
 from app.api.v1.routes import router as api_router
+from app.services.redis_service import RedisService
+from app.services.tfnsw_service import TfnswService
 
 # Load environment variables
 load_dotenv()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Create the shared Redis connection pool and TFNSW service, and release them on shutdown
+    """
+    app.state.redis = await RedisService.get_redis()
+    app.state.tfnsw_service = TfnswService()
+    try:
+        yield
+    finally:
+        await app.state.tfnsw_service.aclose()
+        await RedisService.close()
+
 app = FastAPI(
     title=settings.APP_NAME,
     description="Backend for Frontend service for Transport for NSW Trip Planner API",
     version=settings.APP_VERSION,
-    root_path="/route-wise"
+    root_path="/route-wise",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# Redis connection
-redis_client = Redis(
-    host=settings.REDIS_HOST,
-    port=settings.REDIS_PORT,
-    db=settings.REDIS_DB,
-    decode_responses=True
-)
+# Cache GET responses for trip plans and service alerts in Redis
+app.add_middleware(ResponseCacheMiddleware)
 
 # Include API routes
 app.include_router(api_router, prefix="/api/v1")
@@ -31,7 +45,7 @@ async def health_check():
     Health check endpoint
     """
     try:
-        redis_response = await redis_client.ping()
+        redis_response = await app.state.redis.ping()
         return {
             "status": "healthy",
             "redis": "connected" if redis_response else "disconnected"
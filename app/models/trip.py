@@ -1,8 +1,14 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 from typing import List, Optional
-from datetime import datetime
+
+from app.utils.date_utils import parse_iso_datetime
+
+# Shared config for the read-only response models
+RESPONSE_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore")
 
 class Location(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
     name: str = "Unknown"
     translated_name: Optional[str] = None
     departure_time: Optional[str] = None
@@ -11,6 +17,8 @@ class Location(BaseModel):
     arrival_delay: Optional[int] = None    # Arrival delay in minutes, positive means delayed
 
 class TripLeg(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
     mode: str = "Unknown"
     line: Optional[str] = None
     duration: int = 0  # Duration in minutes
@@ -18,11 +26,15 @@ class TripLeg(BaseModel):
     destination: Location
 
 class StopSequence(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
     name: str = "Unknown"
     translated_name: Optional[str] = None
     arrivalTimePlanned: Optional[str] = None
 
 class Journey(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
     duration: int = Field(ge=0, description="Total journey duration in minutes")
     start_time: str
     end_time: str
@@ -35,18 +47,32 @@ class Journey(BaseModel):
     # access_fee: Optional[float] = Field(None, description="Station access fee in AUD")
 
 class TripResponse(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
     journeys: List[Journey] = []
 
+# Compiled once and reused to validate and serialize every trip response straight to JSON bytes
+TRIP_RESPONSE_ADAPTER = TypeAdapter(TripResponse)
+# Per-journey counterpart, used for the NDJSON streaming endpoint
+JOURNEY_ADAPTER = TypeAdapter(Journey)
+
 class TripRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     from_location: str = Field(..., description="Starting location")
     to_location: str = Field(..., description="Destination location")
-    departure_time: Optional[str] = Field(None, description="Reference time in ISO format (e.g., 2024-03-20T09:00:00)")
-    
-    def validate_request(self) -> None:
-        """Validate request parameters"""
-        # Validate time format if provided
-        if self.departure_time:
+    departure_time: Optional[str] = Field(
+        None,
+        description="Reference time in ISO format (e.g., 2024-03-20T09:00:00)"
+    )
+
+    @field_validator("departure_time")
+    @classmethod
+    def validate_departure_time(cls, value: Optional[str]) -> Optional[str]:
+        """Accept anything the time parser accepts (the parse is memoized, so format_time reuses it)"""
+        if value:
             try:
-                datetime.fromisoformat(self.departure_time.replace('Z', '+00:00'))
+                parse_iso_datetime(value)
             except ValueError:
-                raise ValueError("Time must be in ISO format (e.g., 2024-03-20T09:00:00)") 
\ No newline at end of file
+                raise ValueError("Time must be in ISO format (e.g., 2024-03-20T09:00:00)")
+        return value
\ No newline at end of file
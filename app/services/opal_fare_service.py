@@ -1,15 +1,48 @@
+from bisect import bisect_left
+import hashlib
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
 import re
-from typing import Dict, Optional, Tuple, Any
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple, Any
+
+import msgpack
 
 logger = logging.getLogger(__name__)
 
+# Precomputed station distances. The JSON is the source of truth; the msgpack build decodes much
+# faster and is used only while it records the SHA-256 of the current JSON
+DISTANCE_MAP_MSGPACK_PATH = Path("app/data/distance_map.msgpack")
+DISTANCE_MAP_JSON_PATH = Path("app/data/distance_map.json")
+
+# Upper bounds (km, inclusive) of the rail fare distance bands and their names
+_FARE_BAND_THRESHOLDS = (10, 20, 35, 65)
+_FARE_BAND_NAMES = ("0-10", "10-20", "20-35", "35-65", "65+")
+
+# Patterns used to normalise station names before distance lookups
+_PLATFORM_RE = re.compile(r', Platform \d+')
+_SUBURB_RE = re.compile(r', [A-Za-z ]+$')
+_STATION_SUFFIX_RE = re.compile(r' Station$')
+
+@lru_cache(maxsize=4096)
+def _clean_station_name(station_name: str) -> str:
+    """Clean station name by removing platform info and city/suburb names"""
+    original_name = station_name
+    # Remove platform information, then city/suburb names, then the "Station" suffix
+    station_name = _STATION_SUFFIX_RE.sub('', _SUBURB_RE.sub('', _PLATFORM_RE.sub('', station_name)))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Cleaned station name from '%s' to '%s'", original_name, station_name)
+    return station_name
+
 class OpalFareService:
     def __init__(self):
-        self.distance_map = None
+        self.distance_count = 0
         self.load_distance_map()
+        # Station pairs repeat heavily across journeys and the distance map never changes once loaded
+        self._lookup_distance = lru_cache(maxsize=8192)(self._lookup_distance)
+        self._calculate_fare_cached = lru_cache(maxsize=16384)(self._calculate_fare_cached)
         
         # 2024 July Opal fares for trains (in AUD)
         self.rail_fare_bands = {
@@ -33,28 +66,46 @@ class OpalFareService:
         self.off_peak_discount = 0.30
     
     def load_distance_map(self) -> None:
-        """Load the distance map from JSON file"""
+        """Load the distance map, preferring the msgpack build when it matches the JSON"""
         try:
-            file_path = Path("app/data/distance_map.json")
-            logger.debug(f"Loading distance map from: {file_path.absolute()}")
-            with open(file_path, 'r', encoding='utf-8') as f:
-                self.distance_map = json.load(f)
-            logger.info(f"Successfully loaded distance map with {len(self.distance_map)} entries")
+            json_bytes = DISTANCE_MAP_JSON_PATH.read_bytes()
+            distance_map = None
+            if DISTANCE_MAP_MSGPACK_PATH.exists():
+                build = msgpack.unpackb(DISTANCE_MAP_MSGPACK_PATH.read_bytes(), raw=False)
+                # Hashing the JSON bytes is far cheaper than parsing them
+                if isinstance(build, dict) and build.get("source_sha256") == hashlib.sha256(json_bytes).hexdigest():
+                    logger.debug("Loading distance map from: %s", DISTANCE_MAP_MSGPACK_PATH.absolute())
+                    distance_map = build["distances"]
+                else:
+                    logger.warning("%s is stale, loading %s instead (rerun scripts/generate_distance_map.py)",
+                                   DISTANCE_MAP_MSGPACK_PATH, DISTANCE_MAP_JSON_PATH)
+            if distance_map is None:
+                logger.debug("Loading distance map from: %s", DISTANCE_MAP_JSON_PATH.absolute())
+                distance_map = json.loads(json_bytes)
+            # Intern station names to small integer ids and index distances by the packed id pair,
+            # so a lookup hashes a single int instead of building and hashing a string key.
+            # The string-keyed map is not kept once the index is built, only its size
+            self._station_ids: Dict[str, int] = {}
+            self._distances: Dict[int, float] = {}
+            for key, distance in distance_map.items():
+                origin, destination = key.split('->')
+                a = self._station_ids.setdefault(origin, len(self._station_ids))
+                b = self._station_ids.setdefault(destination, len(self._station_ids))
+                self._distances[self._pair_key(a, b)] = float(distance)
+            self.distance_count = len(distance_map)
+            logger.info("Successfully loaded distance map with %s entries", self.distance_count)
         except Exception as e:
-            logger.error(f"Failed to load distance map: {e}")
+            logger.error("Failed to load distance map: %s", e)
             raise
     
+    @staticmethod
+    def _pair_key(a: int, b: int) -> int:
+        """Pack two station ids into one order-independent integer key"""
+        return (a << 16) | b if a < b else (b << 16) | a
+    
     def clean_station_name(self, station_name: str) -> str:
         """Clean station name by removing platform info and city/suburb names"""
-        original_name = station_name
-        # Remove platform information
-        station_name = re.sub(r', Platform \d+', '', station_name)
-        # Remove city/suburb names
-        station_name = re.sub(r', [A-Za-z ]+$', '', station_name)
-        # Remove "Station" suffix
-        station_name = re.sub(r' Station$', '', station_name)
-        logger.debug(f"Cleaned station name from '{original_name}' to '{station_name}'")
-        return station_name
+        return _clean_station_name(station_name)
     
     def get_station_distance(self, origin: str, destination: str) -> Optional[float]:
         """Get the distance between two stations"""
@@ -62,81 +113,84 @@ class OpalFareService:
             # Clean station names
             clean_origin = self.clean_station_name(origin)
             clean_destination = self.clean_station_name(destination)
-            
-            logger.debug(f"Searching for distance between '{clean_origin}' and '{clean_destination}'")
-            
-            # Create key for distance map (stations sorted alphabetically)
-            stations_sorted = tuple(sorted([clean_origin, clean_destination]))
-            key = f"{stations_sorted[0]}->{stations_sorted[1]}"
-            
-            # Get distance from map
-            if key not in self.distance_map:
-                logger.warning(f"No distance found for key: {key}")
-                return None
-                
-            distance = self.distance_map[key]
-            logger.info(f"Found distance between {clean_origin} and {clean_destination}: {distance}km")
-            return float(distance)
+            return self._lookup_distance(clean_origin, clean_destination)
         except Exception as e:
-            logger.error(f"Error finding distance between {origin} and {destination}: {e}")
+            logger.error("Error finding distance between %s and %s: %s", origin, destination, e)
             return None
     
+    def _lookup_distance(self, clean_origin: str, clean_destination: str) -> Optional[float]:
+        """Look up the distance between two cleaned station names (memoized per instance)"""
+        logger.debug("Searching for distance between '%s' and '%s'", clean_origin, clean_destination)
+        
+        # Get distance from the order-independent station id index
+        a = self._station_ids.get(clean_origin)
+        b = self._station_ids.get(clean_destination)
+        distance = None if a is None or b is None else self._distances.get(self._pair_key(a, b))
+        if distance is None:
+            logger.warning("No distance found for stations: %s -> %s", clean_origin, clean_destination)
+            return None
+            
+        logger.info("Found distance between %s and %s: %skm", clean_origin, clean_destination, distance)
+        return distance
+    
     def get_fare_band(self, distance: float) -> str:
         """Get the fare band for a given distance"""
-        logger.debug(f"Determining fare band for distance: {distance}km")
-        if distance <= 10:
-            band = "0-10"
-        elif distance <= 20:
-            band = "10-20"
-        elif distance <= 35:
-            band = "20-35"
-        elif distance <= 65:
-            band = "35-65"
-        else:
-            band = "65+"
-        logger.debug(f"Selected fare band: {band}")
-        return band
+        # Band upper bounds are inclusive, so bisect_left maps e.g. exactly 10km to "0-10"
+        return _FARE_BAND_NAMES[bisect_left(_FARE_BAND_THRESHOLDS, distance)]
     
     def calculate_access_fee(self, station_name: str) -> float:
         """Calculate access fee for a station if applicable"""
         clean_station = self.clean_station_name(station_name)
         return self.station_access_fees.get(clean_station, 0.0)
     
-    def calculate_fare(self, origin: str, destination: str, is_off_peak: bool = False) -> Optional[Dict[str, Any]]:
-        """Calculate the Opal fare between two stations"""
+    def calculate_fare(self, origin: str, destination: str, is_off_peak: bool = False) -> Optional[Mapping[str, Any]]:
+        """
+        Calculate the Opal fare between two stations
+        
+        Returns:
+            Optional[Mapping[str, Any]]: Read-only fare breakdown shared between callers, or None
+        """
         try:
-            logger.info(f"Calculating fare from {origin} to {destination} (off-peak: {is_off_peak})")
-            distance = self.get_station_distance(origin, destination)
-            if distance is None:
-                logger.warning(f"Could not calculate fare between {origin} and {destination} - distance not found")
-                return None
-            
-            fare_band = self.get_fare_band(distance)
-            base_fare = self.rail_fare_bands[fare_band]
-            
-            # Calculate off-peak fare with 30% discount
-            off_peak_fare = None
-            if is_off_peak:
-                off_peak_fare = round(base_fare * (1 - self.off_peak_discount), 2)
-            
-            # Calculate access fees
-            origin_access_fee = self.calculate_access_fee(origin)
-            destination_access_fee = self.calculate_access_fee(destination)
-            total_access_fee = origin_access_fee + destination_access_fee
-            
-            result = {
-                "distance": distance,
-                "fare_band": fare_band,
-                "base_fare": base_fare,
-                "off_peak_fare": off_peak_fare,
-                "access_fee": total_access_fee,
-                "total_fare": round(base_fare + total_access_fee, 2),
-                "total_off_peak_fare": round(off_peak_fare + total_access_fee, 2) if is_off_peak else None
-            }
-            
-            logger.info(f"Calculated fare for {origin} to {destination}: {result}")
-            return result
-            
+            logger.info("Calculating fare from %s to %s (off-peak: %s)", origin, destination, is_off_peak)
+            # Clean up front so every spelling of the same station pair shares one cache entry
+            return self._calculate_fare_cached(
+                self.clean_station_name(origin),
+                self.clean_station_name(destination),
+                is_off_peak
+            )
         except Exception as e:
-            logger.error(f"Error calculating fare: {e}")
-            return None 
\ No newline at end of file
+            logger.error("Error calculating fare: %s", e)
+            return None
+    
+    def _calculate_fare_cached(self, origin: str, destination: str, is_off_peak: bool) -> Optional[Mapping[str, Any]]:
+        """Calculate the fare between two cleaned station names (memoized per instance)"""
+        distance = self._lookup_distance(origin, destination)
+        if distance is None:
+            logger.warning("Could not calculate fare between %s and %s - distance not found", origin, destination)
+            return None
+        
+        fare_band = self.get_fare_band(distance)
+        base_fare = self.rail_fare_bands[fare_band]
+        
+        # Calculate off-peak fare with 30% discount
+        off_peak_fare = None
+        if is_off_peak:
+            off_peak_fare = round(base_fare * (1 - self.off_peak_discount), 2)
+        
+        # Calculate access fees
+        origin_access_fee = self.station_access_fees.get(origin, 0.0)
+        destination_access_fee = self.station_access_fees.get(destination, 0.0)
+        total_access_fee = origin_access_fee + destination_access_fee
+        
+        result = {
+            "distance": distance,
+            "fare_band": fare_band,
+            "base_fare": base_fare,
+            "off_peak_fare": off_peak_fare,
+            "access_fee": total_access_fee,
+            "total_fare": round(base_fare + total_access_fee, 2),
+            "total_off_peak_fare": round(off_peak_fare + total_access_fee, 2) if is_off_peak else None
+        }
+        
+        logger.info("Calculated fare for %s to %s: %s", origin, destination, result)
+        return MappingProxyType(result)
\ No newline at end of file
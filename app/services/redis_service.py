@@ -1,3 +1,4 @@
+import asyncio
 from redis import asyncio as aioredis
 from app.core.config import settings
 import logging
@@ -7,6 +8,7 @@ logger = logging.getLogger(__name__)
 class RedisService:
     _instance = None
     _redis = None
+    _init_lock = asyncio.Lock()
 
     def __new__(cls):
         if cls._instance is None:
@@ -15,16 +17,26 @@ class RedisService:
 
     @classmethod
     async def get_redis(cls):
-        """Get Redis connection instance"""
-        if cls._redis is None:
+        """Get the shared Redis client, backed by a single connection pool"""
+        # Fast path once the client exists
+        if cls._redis is not None:
+            return cls._redis
+        
+        async with cls._init_lock:
+            # Another task may have created the client while we waited
+            if cls._redis is not None:
+                return cls._redis
             try:
-                # Create Redis connection
-                redis_url = f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}"
-                cls._redis = await aioredis.from_url(
+                # Create the connection pool shared by every Redis user in the process,
+                # callers wait for a free connection instead of failing when it is exhausted
+                redis_url = f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB}"
+                pool = aioredis.BlockingConnectionPool.from_url(
                     redis_url,
+                    max_connections=64,
                     encoding="utf-8",
                     decode_responses=True
                 )
+                cls._redis = aioredis.Redis(connection_pool=pool)
                 logger.info(f"Connected to Redis at {settings.REDIS_HOST}:{settings.REDIS_PORT}")
             except Exception as e:
                 logger.error(f"Failed to connect to Redis: {str(e)}")
@@ -32,6 +44,15 @@ class RedisService:
                 raise e
         return cls._redis
 
+    @classmethod
+    async def close(cls) -> None:
+        """Close the shared Redis client and its connection pool"""
+        if cls._redis is not None:
+            redis = cls._redis
+            cls._redis = None
+            await redis.aclose()
+            await redis.connection_pool.disconnect()
+
     @classmethod
     async def check_health(cls) -> dict:
         """Check Redis connection health"""
@@ -1,73 +1,237 @@
-import json
 import logging
 import os
 import re
-from typing import Dict, Optional
+import sys
+from collections import ChainMap, OrderedDict
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+import orjson
 from app.services.redis_service import RedisService
 
 logger = logging.getLogger(__name__)
 
+# 括号内容，以及交通方式名称中的 "Sydney" / "Network" 通用词
+_PAREN_RE = re.compile(r'\s*\([^)]*\)')
+_SYD_RE = re.compile(r'sydney\s+')
+_NET_RE = re.compile(r'\s+network')
+
+# 站名中需要去除的站台编号及常见后缀：车站、轻轨、渡轮码头（单次扫描）
+_STATION_CLEAN_RE = re.compile(r', Platform \d+| Station| Light Rail| Wharf')
+
+# 站台、码头编号中的数字
+_DIGITS_RE = re.compile(r'\d+')
+
+# 渡轮码头的 Side 标识（如 "Side A"）
+_SIDE_RE = re.compile(r'\bSide\s+(\w+)')
+
+# 交通方式关键词及对应的标准类型，按顺序匹配（trainlink 必须排在 train 之前）
+_MODE_KEYWORDS = (
+    ("trainlink", "trainlink"),
+    ("train", "train"),
+    ("metro", "metro"),
+    ("ferries", "ferry"),
+    ("ferry", "ferry"),
+    ("light rail", "lightrail"),
+    ("lightrail", "lightrail"),
+    ("foot", "footpath"),
+)
+
+# 单字母交通方式代码
+_MODE_CODES = {"t": "train", "m": "metro", "f": "ferry", "l": "lightrail"}
+
+@lru_cache(maxsize=256)
+def _normalize_transport_mode(mode_name: str) -> Optional[str]:
+    """获取标准化的交通工具类型（交通方式名称种类很少，结果按原始名称缓存）"""
+    mode_name = mode_name.lower()
+    logger.debug("Getting transport mode for: %s", mode_name)
+    
+    # 单字母代码直接查表，无需正则处理
+    mode = _MODE_CODES.get(mode_name)
+    if mode:
+        return mode
+    
+    # 移除 "Sydney" 和 "Network" 等通用词
+    mode_name = _SYD_RE.sub('', mode_name)
+    mode_name = _NET_RE.sub('', mode_name)
+    
+    mode = _MODE_CODES.get(mode_name)
+    if mode:
+        return mode
+    
+    for keyword, mode in _MODE_KEYWORDS:
+        if keyword in mode_name:
+            return mode
+    
+    logger.warning("Unknown transport mode: %s", mode_name)
+    return None
+
+# 翻译数据目录
+_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
+
+# 各交通方式对应的站名翻译文件
+_STATION_FILES = {
+    "train": "train_stations.json",
+    "metro": "metro_stations.json",
+    "ferry": "ferry_stations.json",
+    "lightrail": "lightrail_stations.json",
+    "trainlink": "trainlink_stations.json"
+}
+
+# 跨模式查找在扁平索引中使用的交通方式占位符
+_ANY_MODE = "*"
+
+def _translation_file_path(filename: str) -> str:
+    """获取翻译文件路径"""
+    # 根据文件名选择不同的目录
+    if filename in ["common_translation.json", "suburbs.json"]:
+        return os.path.join(_DATA_DIR, filename)
+    return os.path.join(_DATA_DIR, "stations", filename)
+
+def _intern_keys(data: Dict) -> Dict:
+    """驻留站名及语言代码等字典键，使各文件、各索引中重复的键共享同一个字符串对象"""
+    return {
+        sys.intern(key): (
+            {sys.intern(k): v for k, v in value.items()} if isinstance(value, dict) else value
+        )
+        for key, value in data.items()
+    }
+
+def _load_translation_file(filename: str) -> Dict:
+    """加载翻译文件"""
+    try:
+        file_path = _translation_file_path(filename)
+        
+        logger.info("Loading translation file from: %s", file_path)
+        if not os.path.exists(file_path):
+            logger.error("Translation file not found: %s", file_path)
+            return {}
+                           
+        with open(file_path, 'rb') as f:
+            translations = _intern_keys(orjson.loads(f.read()))
+            logger.debug("Successfully loaded %s translations from %s", len(translations), filename)
+            return translations
+    except Exception as e:
+        logger.error("Error loading translation file %s: %s", filename, e)
+        return {}
+
+def _flatten_translations(translations: Dict[str, Dict],
+                          all_translations: ChainMap,
+                          languages) -> Dict[Tuple[str, str, str], Optional[str]]:
+    """
+    构建 (站名, 交通方式, 语言) -> 翻译 的扁平索引
+    
+    某交通方式下存在该站名但缺少该语言时值为 None，与原先只查该模式、不再跨模式回退的行为一致。
+    跨模式查找使用 (站名, "*", 语言)，优先级与 all_translations 相同。
+    
+    Returns:
+        Dict: 扁平化的翻译索引
+    """
+    flat: Dict[Tuple[str, str, str], Optional[str]] = {}
+    for mode, mode_translations in translations.items():
+        for name, names_by_language in mode_translations.items():
+            for language in languages:
+                flat[(name, mode, language)] = names_by_language.get(language)
+    for name, names_by_language in all_translations.items():
+        for language in languages:
+            flat[(name, _ANY_MODE, language)] = names_by_language.get(language)
+    return flat
+
+@lru_cache(maxsize=1)
+def _load_translation_data() -> Tuple[Dict[str, Dict], Dict, Dict, ChainMap, Dict[Tuple[str, str, str], Optional[str]]]:
+    """
+    加载并合并所有翻译数据（每个进程只执行一次）
+    
+    Returns:
+        Tuple: (按交通方式分组的翻译, 通用翻译, 地区翻译, 合并后的全部翻译, 扁平化的翻译索引)
+    """
+    languages = StationTranslationService.available_languages
+    translations: Dict[str, Dict] = {
+        mode: _load_translation_file(filename) for mode, filename in _STATION_FILES.items()
+    }
+    # 加载通用翻译
+    common_translations = _load_translation_file("common_translation.json")
+    
+    # 加载地区翻译
+    suburbs = _load_translation_file("suburbs.json")
+    logger.info("Loaded suburbs translations: %s", suburbs)
+    
+    # 跨模式查找视图（不复制数据），后加载的模式优先，与原先 dict.update 的覆盖顺序一致
+    all_translations = ChainMap(*reversed(translations.values()))
+    flat = _flatten_translations(translations, all_translations, languages)
+    
+    return translations, common_translations, suburbs, all_translations, flat
+
 class StationTranslationService:
     # 定义支持的语言代码
     available_languages = {"en", "zh", "ar", "ja", "ko", "ru", "th"}
 
     def __init__(self):
-        self.translations: Dict[str, Dict] = {
-            "train": self._load_translations("train_stations.json"),
-            "metro": self._load_translations("metro_stations.json"),
-            "ferry": self._load_translations("ferry_stations.json"),
-            "lightrail": self._load_translations("lightrail_stations.json"),
-            "trainlink": self._load_translations("trainlink_stations.json")
-        }
-        # 加载通用翻译
-        self.common_translations = self._load_translations("common_translation.json")
-        
-        # 加载地区翻译
-        self.suburbs = self._load_translations("suburbs.json")
-        logger.info(f"Loaded suburbs translations: {self.suburbs}")
-        
-        # 合并所有翻译以便跨模式查找
-        self.all_translations = {}
-        for mode_translations in self.translations.values():
-            self.all_translations.update(mode_translations)
+        # 翻译数据只在首次实例化时从磁盘加载，之后的实例共享同一份只读数据
+        (self.translations,
+         self.common_translations,
+         self.suburbs,
+         self.all_translations,
+         self._flat) = _load_translation_data()
         
         # Redis缓存前缀
         self.cache_prefix = "station_translation:"
         # 缓存过期时间（24小时）
         self.cache_ttl = 86400
         
+        # 共享的异步 Redis 客户端，首次使用时获取
+        self._redis = None
+        
+        # Redis 前的进程内 LRU 缓存，键为 (station_name, transport_mode, language_code)
+        self.local_cache_size = 10000
+        self._local_cache: OrderedDict[tuple[str, str, str], str] = OrderedDict()
+        
+        # 进程内缓存单个站名的翻译结果（翻译数据在初始化后不再变化）
+        self._translate_station_name = lru_cache(maxsize=8192)(self._translate_station_name)
+        
         logger.info("Station translation service initialized")
-        logger.debug(f"Loaded translations for modes: {list(self.translations.keys())}")
-        logger.debug(f"Total unique stations: {len(self.all_translations)}")
-        logger.debug(f"Available languages: {self.available_languages}")
-        logger.debug(f"Loaded {len(self.suburbs)} suburb translations")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Loaded translations for modes: %s", list(self.translations.keys()))
+            logger.debug("Total unique stations: %s", len(self.all_translations))
+            logger.debug("Available languages: %s", self.available_languages)
+            logger.debug("Loaded %s suburb translations", len(self.suburbs))
+
+    async def _client(self):
+        """获取并保存共享的 Redis 客户端（redis.asyncio，不会阻塞事件循环）"""
+        if self._redis is None:
+            self._redis = await RedisService.get_redis()
+        return self._redis
 
     async def _get_from_cache(self, cache_key: str) -> Optional[str]:
         """从Redis缓存获取翻译结果"""
         try:
-            redis = await RedisService.get_redis()
+            redis = await self._client()
             if redis:
                 cached_value = await redis.get(f"{self.cache_prefix}{cache_key}")
                 if cached_value:
-                    logger.debug(f"Cache hit for key: {cache_key}")
+                    logger.debug("Cache hit for key: %s", cache_key)
                     return cached_value
         except Exception as e:
-            logger.error(f"Error getting from Redis cache: {str(e)}")
+            logger.error("Error getting from Redis cache: %s", e)
         return None
 
-    async def _set_to_cache(self, cache_key: str, value: str) -> None:
-        """将翻译结果存入Redis缓存"""
+    async def _set_many_to_cache(self, items: list[tuple[str, str]]) -> None:
+        """
+        通过一次 pipeline 将多个翻译结果批量存入Redis缓存（尽力而为，失败只记录日志）
+        
+        Args:
+            items: 包含(完整缓存键, value)元组的列表
+        """
         try:
-            redis = await RedisService.get_redis()
+            redis = await self._client()
             if redis:
-                await redis.set(
-                    f"{self.cache_prefix}{cache_key}",
-                    value,
-                    ex=self.cache_ttl
-                )
-                logger.debug(f"Cached translation for key: {cache_key}")
+                async with redis.pipeline(transaction=False) as pipe:
+                    for cache_key, value in items:
+                        pipe.set(cache_key, value, ex=self.cache_ttl)
+                    await pipe.execute()
+                logger.debug("Cached %s translations", len(items))
         except Exception as e:
-            logger.error(f"Error setting to Redis cache: {str(e)}")
+            logger.error("Error setting to Redis cache: %s", e)
 
     async def translate_station_names_batch(self, 
                                           stations: list[tuple[str, str]], 
@@ -76,148 +240,281 @@ class StationTranslationService:
         批量翻译站台名称，使用Redis缓存优化性能
         
         Args:
-            stations: 包含(station_name, transport_mode)元组的列表
+            stations: 包含(station_name, transport_mode)元组的列表，可以包含重复项
             language_code: 目标语言代码 (默认: "en")
             
         Returns:
             Dict[str, str]: 站台名称到翻译的映射
         """
         if not stations or language_code == "en":
-            logger.debug(f"No translation needed for {len(stations) if stations else 0} stations")
-            return {station[0]: station[0] for station in stations}
+            logger.debug("No translation needed for %s stations", len(stations) if stations else 0)
+            names = [station_name for station_name, _ in stations]
+            return dict(zip(names, names))
 
         # 验证language_code是否支持
         if language_code not in self.available_languages:
-            logger.warning(f"Unsupported language code: {language_code}, falling back to 'en'")
-            return {station[0]: station[0] for station in stations}
+            logger.warning("Unsupported language code: %s, falling back to 'en'", language_code)
+            names = [station_name for station_name, _ in stations]
+            return dict(zip(names, names))
 
-        logger.info(f"Starting batch translation for {len(stations)} stations to {language_code}")
+        # 去重（保持首次出现的顺序），相同的站名和交通方式只查询、翻译一次
+        stations = list(dict.fromkeys(stations))
+        
+        logger.info("Starting batch translation for %s stations to %s", len(stations), language_code)
         translations = {}
-        # 批量获取缓存键
+        
+        # 先查进程内缓存，只有未命中的站名才需要访问 Redis
+        pending = []
+        for station_name, transport_mode in stations:
+            local_result = self._local_get((station_name, transport_mode, language_code))
+            if local_result is not None:
+                translations[station_name] = local_result
+            else:
+                pending.append((station_name, transport_mode))
+        if not pending:
+            logger.debug("All %s stations served from local cache", len(stations))
+            return translations
+        stations = pending
+        
+        # 批量获取缓存键（已包含前缀，可直接用于 Redis 读写）
+        cache_prefix = self.cache_prefix
         cache_keys = [
-            f"{station_name}_{transport_mode}_{language_code}"
+            f"{cache_prefix}{station_name}_{transport_mode}_{language_code}"
             for station_name, transport_mode in stations
         ]
         
+        # 需要写入Redis的新翻译结果
+        to_cache = []
         try:
             # 批量从Redis获取缓存
-            redis = await RedisService.get_redis()
+            redis = await self._client()
             if redis:
-                logger.debug(f"Fetching translations from Redis for {len(cache_keys)} keys")
-                cached_results = await redis.mget([f"{self.cache_prefix}{key}" for key in cache_keys])
+                logger.debug("Fetching translations from Redis for %s keys", len(cache_keys))
+                cached_results = await redis.mget(cache_keys)
                 
                 # 处理缓存结果
                 cache_hits = 0
+                misses = []
                 for i, (station_name, transport_mode) in enumerate(stations):
                     if cached_results[i]:
                         translations[station_name] = cached_results[i]
+                        self._local_set((station_name, transport_mode, language_code), cached_results[i])
                         cache_hits += 1
-                        logger.debug(f"Cache hit for '{cache_keys[i]}'")
+                        logger.debug("Cache hit for '%s'", cache_keys[i])
                         continue
-                        
-                    # 如果缓存未命中，执行翻译
-                    transport_type = self._get_transport_mode(transport_mode)
-                    if not transport_type:
-                        logger.warning(f"Unsupported transport mode: {transport_mode} for station {station_name}")
-                        translations[station_name] = station_name
-                        continue
-
-                    result = self._translate_station_name(station_name, transport_type, language_code)
+                    misses.append(i)
+                
+                # 缓存未命中的站名一次性翻译
+                missed_results = self.translate_many([stations[i] for i in misses], language_code)
+                for i, result in zip(misses, missed_results):
+                    station_name, transport_mode = stations[i]
                     translations[station_name] = result
-                    logger.debug(f"Translated '{station_name}' to '{result}' using {transport_type}")
-                    
-                    # 异步存入缓存
-                    await self._set_to_cache(cache_keys[i], result)
+                    self._local_set((station_name, transport_mode, language_code), result)
+                    # 不支持的交通方式不写入缓存
+                    if not self._get_transport_mode(transport_mode):
+                        continue
+                    logger.debug("Translated '%s' to '%s'", station_name, result)
+                    to_cache.append((cache_keys[i], result))
                 
-                logger.info(f"Translation completed: {cache_hits} cache hits, {len(stations) - cache_hits} new translations")
+                logger.info("Translation completed: %s cache hits, %s new translations", cache_hits, len(stations) - cache_hits)
         except Exception as e:
-            logger.error(f"Error in batch translation with Redis: {str(e)}")
-            # 发生错误时回退到非缓存模式
-            for station_name, transport_mode in stations:
-                transport_type = self._get_transport_mode(transport_mode)
-                if not transport_type:
-                    translations[station_name] = station_name
-                    continue
-                    
-                result = self._translate_station_name(station_name, transport_type, language_code)
+            logger.error("Error in batch translation with Redis: %s", e)
+            # 发生错误时回退到非缓存模式，翻译全部站名后仍尝试写入缓存
+            to_cache = []
+            results = self.translate_many(stations, language_code)
+            for i, ((station_name, transport_mode), result) in enumerate(zip(stations, results)):
                 translations[station_name] = result
+                self._local_set((station_name, transport_mode, language_code), result)
+                if self._get_transport_mode(transport_mode):
+                    to_cache.append((cache_keys[i], result))
+
+        # 新翻译结果通过一次 pipeline 批量写入缓存
+        if to_cache:
+            await self._set_many_to_cache(to_cache)
 
         return translations
 
-    def _load_translations(self, filename: str) -> Dict:
-        """加载翻译文件"""
-        try:
-            # 根据文件名选择不同的目录
-            if filename in ["common_translation.json", "suburbs.json"]:
-                file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
-                                       "data", filename)
-            else:
-                file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
-                                       "data", "stations", filename)
+    def _local_get(self, key: tuple[str, str, str]) -> Optional[str]:
+        """从进程内缓存获取翻译结果"""
+        value = self._local_cache.get(key)
+        if value is not None:
+            self._local_cache.move_to_end(key)
+        return value
+
+    def _local_set(self, key: tuple[str, str, str], value: str) -> None:
+        """将翻译结果存入进程内缓存，超出容量时淘汰最久未使用的条目"""
+        self._local_cache[key] = value
+        self._local_cache.move_to_end(key)
+        if len(self._local_cache) > self.local_cache_size:
+            self._local_cache.popitem(last=False)
+
+    def clear_local_cache(self) -> None:
+        """清空进程内翻译缓存"""
+        self._local_cache.clear()
+
+    def translate_many(self, items: list[tuple[str, str]], language_code: str) -> list[str]:
+        """
+        翻译多个站名，同一次调用中相同的交通方式和站名只处理一次
+        
+        Args:
+            items: 包含(station_name, transport_mode)元组的列表
+            language_code: 目标语言代码
             
-            logger.info(f"Loading translation file from: {file_path}")
-            if not os.path.exists(file_path):
-                logger.error(f"Translation file not found: {file_path}")
-                return {}
-                               
-            with open(file_path, 'r', encoding='utf-8') as f:
-                translations = json.load(f)
-                logger.debug(f"Successfully loaded {len(translations)} translations from {filename}")
-                return translations
-        except Exception as e:
-            logger.error(f"Error loading translation file {filename}: {str(e)}")
-            return {}
+        Returns:
+            list[str]: 与 items 顺序一一对应的翻译结果
+        """
+        modes: Dict[str, Optional[str]] = {}
+        results: Dict[tuple[str, Optional[str]], str] = {}
+        translated = []
+        for station_name, transport_mode in items:
+            if transport_mode not in modes:
+                modes[transport_mode] = self._get_transport_mode(transport_mode)
+            transport_type = modes[transport_mode]
+            
+            key = (station_name, transport_type)
+            if key not in results:
+                # 不支持的交通方式保持原名
+                results[key] = (
+                    self._translate_station_name(station_name, transport_type, language_code)
+                    if transport_type else station_name
+                )
+            translated.append(results[key])
+        return translated
 
     def _get_transport_mode(self, mode_name: str) -> Optional[str]:
         """获取标准化的交通工具类型"""
-        mode_name = mode_name.lower()
-        logger.debug(f"Getting transport mode for: {mode_name}")
-        
-        # 移除 "Sydney" 和 "Network" 等通用词
-        mode_name = re.sub(r'sydney\s+', '', mode_name)
-        mode_name = re.sub(r'\s+network', '', mode_name)
-        
-        if "train" in mode_name or mode_name == "t":
-            return "train"
-        elif "metro" in mode_name or mode_name == "m":
-            return "metro"
-        elif "ferry" in mode_name or "ferries" in mode_name or mode_name == "f":
-            return "ferry"
-        elif "light rail" in mode_name or "lightrail" in mode_name or mode_name == "l":
-            return "lightrail"
-        elif "trainlink" in mode_name:
-            return "trainlink"
-        elif "footpath" in mode_name or "foot" in mode_name:
-            return "footpath"
-        else:
-            logger.warning(f"Unknown transport mode: {mode_name}")
-            return None
+        return _normalize_transport_mode(mode_name)
 
     def _clean_station_name(self, name: str) -> str:
         """Clean station name by removing common suffixes and unnecessary information"""
-        # Remove platform number
-        cleaned_name = re.sub(r', Platform \d+', '', name)
-        
-        # Remove common suffixes
-        suffixes = [
-            " Station",
-            " Light Rail",  # Light Rail
-            " Wharf",  # Ferry wharf
-        ]
-        
-        # Remove other suffixes
-        for suffix in suffixes:
-            cleaned_name = cleaned_name.replace(suffix, "")
+        # Remove platform number and common suffixes (Station, Light Rail, ferry Wharf) in a single pass
+        cleaned_name = _STATION_CLEAN_RE.sub('', name)
             
         # Remove content in parentheses
-        cleaned_name = re.sub(r'\s*\([^)]*\)', '', cleaned_name)
+        cleaned_name = _PAREN_RE.sub('', cleaned_name)
         
         # Remove address part after comma
         # cleaned_name = cleaned_name.split(',')[0].strip()
         
-        logger.debug(f"Cleaned station name: {name} -> {cleaned_name}")
+        logger.debug("Cleaned station name: %s -> %s", name, cleaned_name)
         return cleaned_name.strip()
 
+    def _has_no_translation(self, station_name: str) -> bool:
+        """
+        判断不含逗号的站名是否一定无法翻译（站台、地区、轻轨及站名翻译均不存在）
+        
+        Args:
+            station_name: 原始站名
+            
+        Returns:
+            bool: True 表示翻译结果必定与原名相同
+        """
+        if "," in station_name or "latform" in station_name:
+            return False
+        name = station_name.strip()
+        if name in self.suburbs:
+            return False
+        if "Light Rail" in name and name.replace(" Light Rail", "").strip() in self.all_translations:
+            return False
+        return self._clean_station_name(name) not in self.all_translations
+
+    def _lookup_translation(self, clean_name: str, transport_type: str, language_code: str) -> Optional[str]:
+        """
+        查找站名翻译：优先查找指定交通方式，该方式下不存在该站名时跨模式查找
+        
+        Args:
+            clean_name: 清理后的站名
+            transport_type: 标准化的交通工具类型
+            language_code: 目标语言代码
+            
+        Returns:
+            Optional[str]: 翻译结果，找不到时为 None
+        """
+        key = (clean_name, transport_type, language_code)
+        if key in self._flat:
+            return self._flat[key]
+        return self._flat.get((clean_name, _ANY_MODE, language_code))
+
+    def _common_word(self, key: str, language_code: str) -> str:
+        """获取通用词（station、platform、wharf、side）的翻译，没有翻译时使用英文原词"""
+        return self.common_translations.get(key, {}).get(language_code, key)
+
+    def _translate_suburb(self, part: str, language_code: str) -> Optional[str]:
+        """翻译地区名称，不是已知地区或没有翻译时返回 None"""
+        suburb_name = part.strip()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Checking if '%s' is a suburb in %s", suburb_name, list(self.suburbs.keys()))
+        if suburb_name in self.suburbs:
+            # 从suburbs.json获取地区翻译
+            suburb_translation = self.suburbs[suburb_name].get(language_code)
+            logger.debug("Found suburb translation for '%s': %s", suburb_name, suburb_translation)
+            return suburb_translation or None
+        return None
+
+    def _translate_ferry_main_part(self, main_name: str, language_code: str) -> str:
+        """翻译渡轮站点的主要站点名称"""
+        # 尝试从 ferry_stations.json 获取翻译
+        translation = self._lookup_translation(self._clean_station_name(main_name), "ferry", language_code)
+        if not translation:
+            # 如果没有找到翻译，保持原样
+            return main_name
+        
+        # 处理 Wharf 后缀
+        if "Wharf" in main_name:
+            translation = f"{translation}{self._common_word('wharf', language_code)}"
+        return translation
+
+    def _translate_ferry_part(self, part: str, language_code: str) -> Optional[str]:
+        """翻译渡轮站点名称的其余部分（码头编号、Side A/B、地区）"""
+        # 处理 Wharf 编号，没有编号时省略该部分
+        if "Wharf" in part:
+            wharf_num = ''.join(_DIGITS_RE.findall(part))
+            return f"{self._common_word('wharf', language_code)} {wharf_num}" if wharf_num else None
+        
+        # 处理 Side A/B
+        if "Side" in part:
+            # 获取A或B，无法匹配时沿用最后一个字符
+            side_match = _SIDE_RE.search(part)
+            side = side_match.group(1) if side_match else part.strip()[-1]
+            return f"{self._common_word('side', language_code)} {side}"
+        
+        # 如果不是已知地区或没有翻译，保持原样
+        return self._translate_suburb(part, language_code) or part
+
+    def _translate_part(self, part: str, transport_type: str, language_code: str) -> str:
+        """翻译其他交通工具站点名称中的一个部分（站台、轻轨站、地区或站名）"""
+        # 处理站台信息
+        if "Platform" in part or "platform" in part:
+            platform_num = ''.join(_DIGITS_RE.findall(part))
+            if language_code == "ja":
+                # 日语特殊格式：数字 + 番 + ホーム
+                return f"{platform_num}番ホーム"
+            # 其他语言：platform翻译 + 数字
+            return f"{self._common_word('platform', language_code)} {platform_num}"
+        
+        if "Light Rail" in part:
+            # 提取轻轨站名
+            light_rail_name = part.replace(" Light Rail", "").strip()
+            translation = self._flat.get((light_rail_name, "lightrail", language_code))
+            if translation:
+                return translation
+        
+        # 检查是否是地区名称
+        suburb_translation = self._translate_suburb(part, language_code)
+        if suburb_translation:
+            return suburb_translation
+        
+        # 获取基础翻译
+        translation = self._lookup_translation(self._clean_station_name(part), transport_type, language_code)
+        if not translation:
+            # 如果没有找到翻译，保持原样
+            return part
+        
+        # 添加站台后缀（仅在找到翻译时才检查原名是否带 Station）
+        if "Station" in part:
+            translation = f"{translation}{self._common_word('station', language_code)}"
+        return translation
+
     def _translate_station_name(self, 
                               station_name: str, 
                               transport_type: str,
@@ -226,117 +523,26 @@ class StationTranslationService:
         if language_code == "en" or language_code not in self.available_languages:
             return station_name
         
+        # 快速路径：单段站名且没有任何可用翻译时直接返回，跳过拆分和逐段处理
+        if self._has_no_translation(station_name):
+            return station_name.strip()
+        
         # Split by comma to handle different parts
         parts = [part.strip() for part in station_name.split(',')]
-        translated_parts = []
         
         if transport_type == "ferry":
-            # 处理渡轮站点名称
-            # 第一部分：主要站点名称
-            main_name = parts[0]
-            clean_name = self._clean_station_name(main_name)
-            
-            # 尝试从 ferry_stations.json 获取翻译
-            translation = None
-            if clean_name in self.translations["ferry"]:
-                translation = self.translations["ferry"][clean_name].get(language_code)
-            elif clean_name in self.all_translations:
-                translation = self.all_translations[clean_name].get(language_code)
-            
-            if translation:
-                translated_parts.append(translation)
-                
-                # 处理 Wharf 后缀
-                if "Wharf" in main_name:
-                    wharf_translation = self.common_translations.get("wharf", {}).get(language_code, "wharf")
-                    translated_parts[-1] = f"{translated_parts[-1]}{wharf_translation}"
-            else:
-                # 如果没有找到翻译，保持原样
-                translated_parts.append(main_name)
-            
-            # 处理剩余部分
-            for part in parts[1:]:
-                # 处理 Wharf 编号
-                if "Wharf" in part:
-                    wharf_num = ''.join(filter(str.isdigit, part))
-                    if wharf_num:
-                        wharf_translation = self.common_translations.get("wharf", {}).get(language_code, "wharf")
-                        translated_parts.append(f"{wharf_translation} {wharf_num}")
-                    continue
-                
-                # 处理 Side A/B
-                if "Side" in part:
-                    side = part.strip()[-1]  # 获取A或B
-                    side_translation = self.common_translations.get("side", {}).get(language_code, "side")
-                    translated_parts.append(f"{side_translation} {side}")
-                    continue
-                
-                # 检查是否是地区名称
-                suburb_name = part.strip()
-                logger.debug(f"Checking if '{suburb_name}' is a suburb in {list(self.suburbs.keys())}")
-                if suburb_name in self.suburbs:
-                    # 从suburbs.json获取地区翻译
-                    suburb_translation = self.suburbs[suburb_name].get(language_code)
-                    logger.debug(f"Found suburb translation for '{suburb_name}': {suburb_translation}")
-                    if suburb_translation:
-                        translated_parts.append(suburb_translation)
-                        continue
-                
-                # 如果不是已知地区或没有翻译，保持原样
-                translated_parts.append(part)
+            # 渡轮站点：第一部分为主要站点名称，其余部分为码头编号、Side 或地区
+            translated_parts = [self._translate_ferry_main_part(parts[0], language_code)]
+            translated_parts += [self._translate_ferry_part(part, language_code) for part in parts[1:]]
         else:
-            # 处理其他交通工具的站点名称
-            for part in parts:
-                # 处理站台信息
-                if "Platform" in part or "platform" in part:
-                    platform_num = ''.join(filter(str.isdigit, part))
-                    platform_translation = self.common_translations.get("platform", {}).get(language_code, "platform")
-                    if language_code == "ja":
-                        # 日语特殊格式：数字 + 番 + ホーム
-                        translated_parts.append(f"{platform_num}番ホーム")
-                    else:
-                        # 其他语言：platform翻译 + 数字
-                        translated_parts.append(f"{platform_translation} {platform_num}")
-                    continue
-                
-                if "Light Rail" in part:
-                    # 提取轻轨站名
-                    light_rail_name = part.replace(" Light Rail", "").strip()
-                    if light_rail_name in self.translations["lightrail"]:
-                        translation = self.translations["lightrail"][light_rail_name].get(language_code)
-                        if translation:
-                            translated_parts.append(translation)
-                            continue
-                # 检查是否是地区名称
-                suburb_name = part.strip()
-                logger.debug(f"Checking if '{suburb_name}' is a suburb in {list(self.suburbs.keys())}")
-                if suburb_name in self.suburbs:
-                    # 从suburbs.json获取地区翻译
-                    suburb_translation = self.suburbs[suburb_name].get(language_code)
-                    logger.debug(f"Found suburb translation for '{suburb_name}': {suburb_translation}")
-                    if suburb_translation:
-                        translated_parts.append(suburb_translation)
-                        continue
-                
-                # 处理站名
-                clean_name = self._clean_station_name(part)
-                original_has_station = "Station" in part
-                
-                # 获取基础翻译
-                translation = None
-                if transport_type in self.translations and clean_name in self.translations[transport_type]:
-                    translation = self.translations[transport_type][clean_name].get(language_code)
-                elif clean_name in self.all_translations:
-                    translation = self.all_translations[clean_name].get(language_code)
-                
-                if translation:
-                    # 添加站台后缀
-                    if original_has_station:
-                        station_translation = self.common_translations.get("station", {}).get(language_code, "station")
-                        translation = f"{translation}{station_translation}"
-                    translated_parts.append(translation)
-                else:
-                    # 如果没有找到翻译，保持原样
-                    translated_parts.append(part)
+            # 其他交通工具的站点名称逐段处理
+            translated_parts = [self._translate_part(part, transport_type, language_code) for part in parts]
         
-        return ", ".join(translated_parts) 
\ No newline at end of file
+        # 返回 None 的部分（如没有编号的码头信息）不输出
+        return ", ".join(part for part in translated_parts if part is not None)
+
+
+@lru_cache(maxsize=1)
+def get_translation_service() -> StationTranslationService:
+    """获取进程内共享的站名翻译服务实例"""
+    return StationTranslationService()
\ No newline at end of file
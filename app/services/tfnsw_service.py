@@ -1,24 +1,77 @@
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime
-import json
-from urllib.parse import urlencode
+from types import MappingProxyType
+
+import httpx
 
 from app.core.config import settings
 from app.services.opal_fare_service import OpalFareService
-from app.services.station_translation_service import StationTranslationService
+from app.services.station_translation_service import get_translation_service
 from app.utils.date_utils import (
     SYDNEY_TIMEZONE, 
     is_off_peak_time, 
     convert_to_sydney_time, 
-    format_time
+    format_time,
+    parse_iso_datetime
 )
 from app.utils.api_utils import make_api_request, filter_journeys_by_time
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Shared read-only stand-ins for missing nested objects and lists (legs, stops) in the TfNSW payload
+_EMPTY = MappingProxyType({})
+_EMPTY_LEGS = ()
+
+# Slotted containers for the per-leg and per-stop output, cheaper to build than nested dicts.
+# Field names match the response models, which validate them with from_attributes=True.
+@dataclass(slots=True)
+class FormattedEndpoint:
+    name: str
+    translated_name: Optional[str]
+    departure_time: Optional[str]
+    arrival_time: Optional[str]
+    departure_delay: Optional[int]
+    arrival_delay: Optional[int]
+
+@dataclass(slots=True)
+class FormattedLeg:
+    mode: str
+    line: Optional[str]
+    duration: int
+    origin: FormattedEndpoint
+    destination: FormattedEndpoint
+
+@dataclass(slots=True)
+class FormattedStop:
+    name: str
+    translated_name: Optional[str]
+    arrivalTimePlanned: Optional[str]
+
 class TfnswService:
+    # Query parameters that are identical for every trip request
+    _STATIC_PARAMS = (
+        ("outputFormat", "rapidJSON"),
+        ("coordOutputFormat", "EPSG:4326"),
+        ("depArrMacro", "dep"),  # Always search for departures after the reference time
+        ("type_origin", "stop"),
+        ("type_destination", "stop"),
+        ("calcNumberOfTrips", "10"),  # Fixed number of trips to return
+        ("wheelchair", "false"),
+        ("TfNSWSF", "true"),
+        ("version", "10.2.1.42"),
+    )
+    
+    # Raw trip responses are reused for identical queries within this many seconds. The cache only
+    # needs the routes one worker sees inside that window (Redis covers cross-worker reuse), and each
+    # raw TfNSW payload can run to a few hundred KB, so it is kept small
+    TRIP_CACHE_TTL = 30
+    TRIP_CACHE_SIZE = 64
+    
     def __init__(self):
         self.base_url = settings.TFNSW_API_BASE_URL
         api_key = settings.TFNSW_API_KEY
@@ -30,9 +83,84 @@ class TfnswService:
             "Authorization": f"apikey {api_key}",
             "Accept": "application/json"
         }
+        # Pooled client reused across requests so TLS handshakes and connections are amortised
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=httpx.Timeout(10.0)
+        )
         self.opal_service = OpalFareService()
-        self.translation_service = StationTranslationService()
-        logger.debug(f"Initialized TfnswService with base URL: {self.base_url}")
+        self.translation_service = get_translation_service()
+        # (from, to, itdDate, itdTime) -> (expiry, raw response), plus upstream calls currently in flight
+        self._trip_cache: Dict[Tuple[str, str, str, str], Tuple[float, Dict[str, Any]]] = {}
+        self._trip_inflight: Dict[Tuple[str, str, str, str], asyncio.Task] = {}
+        logger.debug("Initialized TfnswService with base URL: %s", self.base_url)
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled client for the TfNSW API, already carrying the base URL and auth headers"""
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client"""
+        await self._client.aclose()
+    
+    async def __aenter__(self) -> "TfnswService":
+        await self._client.__aenter__()
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self._client.__aexit__(*exc_info)
+    
+    def clear_trip_cache(self) -> None:
+        """Drop all cached raw trip responses"""
+        self._trip_cache.clear()
+    
+    async def _fetch_trip(self, key: Tuple[str, str, str, str], params: list) -> Dict[str, Any]:
+        """
+        Fetch a raw trip response, served from the short-lived cache when possible
+        
+        Concurrent identical queries share a single upstream request.
+        
+        Args:
+            key: Cache key of origin, destination, itdDate and itdTime
+            params: Query parameters for the trip endpoint
+            
+        Returns:
+            Raw trip planning response (shared, must not be mutated)
+        """
+        entry = self._trip_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            logger.debug("Trip cache hit for: %s", key)
+            return entry[1]
+        
+        task = self._trip_inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(make_api_request(self._client, "trip", params))
+            self._trip_inflight[key] = task
+            task.add_done_callback(lambda done: self._store_trip(key, done))
+        # Shield so one caller disconnecting does not cancel the request for the others
+        return await asyncio.shield(task)
+    
+    def _store_trip(self, key: Tuple[str, str, str, str], task: asyncio.Task) -> None:
+        """Cache a finished upstream trip request and release its in-flight slot"""
+        self._trip_inflight.pop(key, None)
+        # Failed requests are not cached, the next caller retries
+        if task.cancelled() or task.exception() is not None:
+            return
+        
+        cache = self._trip_cache
+        cache.pop(key, None)
+        now = time.monotonic()
+        # Entries share one TTL and are kept in insertion order, so expired ones are all at the front
+        while cache:
+            oldest = next(iter(cache))
+            if cache[oldest][0] > now and len(cache) < self.TRIP_CACHE_SIZE:
+                break
+            cache.pop(oldest)
+        cache[key] = (now + self.TRIP_CACHE_TTL, task.result())
     
     async def get_trip_plan(self, 
                           from_location: str,
@@ -52,44 +180,35 @@ class TfnswService:
         # Use provided time or current time as reference
         date_str, time_str = format_time(departure_time)
         
-        params = {
-            "outputFormat": "rapidJSON",
-            "coordOutputFormat": "EPSG:4326",
-            "itdDate": date_str,
-            "itdTime": time_str,
-            "depArrMacro": "dep",  # Always search for departures after the reference time
-            "type_origin": "stop",
-            "name_origin": from_location,
-            "type_destination": "stop",
-            "name_destination": to_location,
-            "calcNumberOfTrips": "10",  # Fixed number of trips to return
-            "wheelchair": "false",
-            "TfNSWSF": "true",
-            "version": "10.2.1.42"
-        }
+        # Constant parameters first, then the per-request ones
+        params = [
+            *self._STATIC_PARAMS,
+            ("itdDate", date_str),
+            ("itdTime", time_str),
+            ("name_origin", from_location),
+            ("name_destination", to_location),
+        ]
         
-        logger.info(f"Requesting trip plan: from {from_location} to {to_location}")
+        logger.info("Requesting trip plan: from %s to %s", from_location, to_location)
         
         try:
-            response_data = await make_api_request(
-                self.base_url, 
-                "trip", 
-                self.headers, 
+            response_data = await self._fetch_trip(
+                (from_location, to_location, date_str, time_str), 
                 params
             )
             
-            # Filter journeys before reference time
+            # Filter journeys before reference time, on a copy since the raw response is cached
             if "journeys" in response_data:
                 journey_count = len(response_data.get("journeys", []))
-                logger.debug(f"Received {journey_count} journeys")
+                logger.debug("Received %d journeys", journey_count)
                 
                 filtered_journeys = filter_journeys_by_time(
                     response_data["journeys"], 
                     departure_time
                 )
                 
-                response_data["journeys"] = filtered_journeys
-                logger.debug(f"After filtering, {len(filtered_journeys)} journeys remain")
+                response_data = {**response_data, "journeys": filtered_journeys}
+                logger.debug("After filtering, %d journeys remain", len(filtered_journeys))
             
             if len(response_data.get("journeys", [])) == 0:
                 logger.warning("No journeys found. This might be due to no available services for the requested time period or route distance/complexity")
@@ -97,7 +216,7 @@ class TfnswService:
             return response_data
                 
         except Exception as e:
-            logger.error(f"Failed to get trip plan: {str(e)}")
+            logger.error("Failed to get trip plan: %s", e)
             raise
     
     async def format_trip_response(self, response: Dict[str, Any], language_code: str = "en") -> Dict[str, Any]:
@@ -110,7 +229,8 @@ class TfnswService:
             
         Returns:
             Formatted trip information with:
-            - journeys: List of journey options with calculated durations and delays
+            - journeys: List of journey options with calculated durations and delays,
+              whose legs and stopSequence entries are FormattedLeg / FormattedStop instances
         """
         logger.debug("Starting response formatting...")
         
@@ -118,61 +238,117 @@ class TfnswService:
         if not response or "journeys" not in response:
             return {"journeys": []}
             
-        journeys = []
+        translations = await self._translate_stations(response, language_code)
+        journeys = list(self._iter_formatted_journeys(response, translations))
+        
+        logger.debug("Response formatting completed. Processed %d journeys.", len(journeys))
+        return {"journeys": journeys}
+    
+    async def stream_trip_response(self, response: Dict[str, Any], language_code: str = "en") -> Iterator[Dict[str, Any]]:
+        """
+        Format the raw API response lazily, one journey at a time
+        
+        Station names are translated up front, so errors surface before anything is streamed.
         
-        # 收集所有需要翻译的站名
+        Args:
+            response: Raw API response
+            language_code: Language code for station name translations (default: "en")
+            
+        Returns:
+            Iterator yielding formatted journeys, in the same shape as format_trip_response
+        """
+        if not response or "journeys" not in response:
+            return iter(())
+        
+        translations = await self._translate_stations(response, language_code)
+        return self._iter_formatted_journeys(response, translations)
+    
+    async def _translate_stations(self, response: Dict[str, Any], language_code: str) -> Dict[str, str]:
+        """
+        Translate every station name in the response in one batch
+        
+        Args:
+            response: Raw API response
+            language_code: Language code for station name translations
+            
+        Returns:
+            Dict mapping original station names to translated names
+        """
+        # 英文不需要翻译，跳过站名收集和翻译服务，译名直接使用原名
+        if language_code == "en":
+            return {}
+        
+        # 收集所有需要翻译的站名（append 绑定为局部变量，减少循环内的属性查找）
         stations_to_translate = []
+        add_station = stations_to_translate.append
         for journey in response.get("journeys", []):
-            for leg in journey.get("legs", []):
-                transport_mode = leg.get("transportation", {}).get("product", {}).get("name", "Unknown")
+            for leg in journey.get("legs") or _EMPTY_LEGS:
+                transport_mode = ((leg.get("transportation") or _EMPTY).get("product") or _EMPTY).get("name", "Unknown")
                 # 添加起点站
-                origin_name = leg.get("origin", {}).get("name", "Unknown")
+                origin_name = (leg.get("origin") or _EMPTY).get("name", "Unknown")
                 if origin_name != "Unknown":
-                    stations_to_translate.append((origin_name, transport_mode))
+                    add_station((origin_name, transport_mode))
                 # 添加终点站
-                dest_name = leg.get("destination", {}).get("name", "Unknown")
+                dest_name = (leg.get("destination") or _EMPTY).get("name", "Unknown")
                 if dest_name != "Unknown":
-                    stations_to_translate.append((dest_name, transport_mode))
+                    add_station((dest_name, transport_mode))
                 # 添加途经站
-                for stop in leg.get("stopSequence", []):
+                for stop in leg.get("stopSequence") or _EMPTY_LEGS:
                     stop_name = stop.get("disassembledName", "Unknown")
                     if stop_name != "Unknown":
-                        stations_to_translate.append((stop_name, transport_mode))
+                        add_station((stop_name, transport_mode))
         
         # 批量获取翻译
-        translations = await self.translation_service.translate_station_names_batch(
-            list(set(stations_to_translate)),  # 去重
+        return await self.translation_service.translate_station_names_batch(
+            stations_to_translate,  # 由翻译服务按顺序去重
             language_code
         )
+    
+    def _iter_formatted_journeys(self, response: Dict[str, Any], translations: Dict[str, str]) -> Iterator[Dict[str, Any]]:
+        """
+        Format each journey of the raw API response
+        
+        Args:
+            response: Raw API response
+            translations: Dict mapping original station names to translated names
+            
+        Returns:
+            Iterator yielding formatted journeys with calculated durations and fares
+        """
+        # Bind the per-leg helpers to locals for the inner loops
+        to_sydney = convert_to_sydney_time
+        translate = translations.get
         
         for journey in response.get("journeys", []):
             # Ensure time fields always have values and are converted to Sydney time
-            start_time = journey.get("legs", [{}])[0].get("origin", {}).get("departureTimePlanned", "")
-            end_time = journey.get("legs", [{}])[-1].get("destination", {}).get("arrivalTimePlanned", "")
+            legs = journey.get("legs") or _EMPTY_LEGS
+            first_origin = (legs[0].get("origin") or _EMPTY) if legs else _EMPTY
+            start_time = first_origin.get("departureTimePlanned", "")
+            end_time = ((legs[-1].get("destination") or _EMPTY) if legs else _EMPTY).get("arrivalTimePlanned", "")
             
             # Calculate total duration (including waiting and transfer times)
             duration = 0
+            start_dt = None
             try:
                 if start_time and end_time:
-                    start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                    end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
+                    start_dt = parse_iso_datetime(start_time)
+                    end_dt = parse_iso_datetime(end_time)
                     duration = int((end_dt - start_dt).total_seconds() / 60)
             except (ValueError, TypeError) as e:
-                logger.warning(f"Could not calculate duration: {e}")
+                logger.warning("Could not calculate duration: %s", e)
             
             # Calculate waiting time until first transport
             waiting_time = None
             try:
                 now = datetime.now(SYDNEY_TIMEZONE)
-                first_leg = journey.get("legs", [{}])[0]
-                first_departure = first_leg.get("origin", {}).get("departureTimeEstimated") or first_leg.get("origin", {}).get("departureTimePlanned")
+                first_departure = first_origin.get("departureTimeEstimated") or first_origin.get("departureTimePlanned")
                 
                 if first_departure:
-                    departure_dt = datetime.fromisoformat(first_departure.replace('Z', '+00:00')).astimezone(SYDNEY_TIMEZONE)
+                    departure_dt = parse_iso_datetime(first_departure).astimezone(SYDNEY_TIMEZONE)
                     # Calculate waiting time regardless of whether it's in the past or future
                     waiting_time = int((departure_dt - now).total_seconds() / 60)
             except (ValueError, TypeError) as e:
-                logger.warning(f"Could not calculate waiting time: {e}")
+                logger.warning("Could not calculate waiting time: %s", e)
                 waiting_time = None
             
             formatted_journey = {
@@ -185,12 +361,12 @@ class TfnswService:
             }
             
             # Calculate fare if it's a train journey
-            if any(leg.get("transportation", {}).get("product", {}).get("class") in [1, 2] for leg in journey.get("legs", [])):
-                origin_station = journey["legs"][0]["origin"]["name"]
-                destination_station = journey["legs"][-1]["destination"]["name"]
+            if any(((leg.get("transportation") or _EMPTY).get("product") or _EMPTY).get("class") in (1, 2) for leg in legs):
+                origin_station = legs[0]["origin"]["name"]
+                destination_station = legs[-1]["destination"]["name"]
                 
-                # Check if the journey is during off-peak hours
-                departure_time = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+                # Check if the journey is during off-peak hours, reusing the start time parsed for the duration
+                departure_time = start_dt if start_dt is not None else parse_iso_datetime(start_time)
                 departure_time = departure_time.astimezone(SYDNEY_TIMEZONE)
                 
                 # Check if it's off-peak time
@@ -217,45 +393,46 @@ class TfnswService:
                 formatted_journey["access_fee"] = None
             
             # Process each leg of the journey
-            for leg in journey.get("legs", []):
-                transport_mode = leg.get("transportation", {}).get("product", {}).get("name", "Unknown")
-                origin_name = leg.get("origin", {}).get("name", "Unknown")
-                destination_name = leg.get("destination", {}).get("name", "Unknown")
+            add_leg = formatted_journey["legs"].append
+            add_stop = formatted_journey["stopSequence"].append
+            for leg in legs:
+                transportation = leg.get("transportation") or _EMPTY
+                origin = leg.get("origin") or _EMPTY
+                destination = leg.get("destination") or _EMPTY
+                transport_mode = (transportation.get("product") or _EMPTY).get("name", "Unknown")
+                origin_name = origin.get("name", "Unknown")
+                destination_name = destination.get("name", "Unknown")
                 
-                formatted_leg = {
-                    "mode": transport_mode,
-                    "line": leg.get("transportation", {}).get("disassembledName", "Unknown"),
-                    "duration": leg.get("duration", 0),
-                    "origin": {
-                        "name": origin_name,
-                        "translated_name": translations.get(origin_name, origin_name),
-                        "departure_time": convert_to_sydney_time(leg.get("origin", {}).get("departureTimePlanned")),
-                        "arrival_time": convert_to_sydney_time(leg.get("origin", {}).get("arrivalTimePlanned")),
-                        "departure_delay": leg.get("origin", {}).get("departureDelay", 0),
-                        "arrival_delay": leg.get("origin", {}).get("arrivalDelay", 0)
-                    },
-                    "destination": {
-                        "name": destination_name,
-                        "translated_name": translations.get(destination_name, destination_name),
-                        "departure_time": convert_to_sydney_time(leg.get("destination", {}).get("departureTimePlanned")),
-                        "arrival_time": convert_to_sydney_time(leg.get("destination", {}).get("arrivalTimePlanned")),
-                        "departure_delay": leg.get("destination", {}).get("departureDelay", 0),
-                        "arrival_delay": leg.get("destination", {}).get("arrivalDelay", 0)
-                    }
-                }
-                formatted_journey["legs"].append(formatted_leg)
+                formatted_leg = FormattedLeg(
+                    mode=transport_mode,
+                    line=transportation.get("disassembledName", "Unknown"),
+                    duration=leg.get("duration", 0),
+                    origin=FormattedEndpoint(
+                        name=origin_name,
+                        translated_name=translate(origin_name, origin_name),
+                        departure_time=to_sydney(origin.get("departureTimePlanned")),
+                        arrival_time=to_sydney(origin.get("arrivalTimePlanned")),
+                        departure_delay=origin.get("departureDelay", 0),
+                        arrival_delay=origin.get("arrivalDelay", 0)
+                    ),
+                    destination=FormattedEndpoint(
+                        name=destination_name,
+                        translated_name=translate(destination_name, destination_name),
+                        departure_time=to_sydney(destination.get("departureTimePlanned")),
+                        arrival_time=to_sydney(destination.get("arrivalTimePlanned")),
+                        departure_delay=destination.get("departureDelay", 0),
+                        arrival_delay=destination.get("arrivalDelay", 0)
+                    )
+                )
+                add_leg(formatted_leg)
                 
                 # Process stop sequence for this leg
-                if "stopSequence" in leg:
-                    for stop in leg["stopSequence"]:
-                        stop_name = stop.get("disassembledName", "Unknown")
-                        formatted_journey["stopSequence"].append({
-                            "name": stop_name,
-                            "translated_name": translations.get(stop_name, stop_name),
-                            "arrivalTimePlanned": convert_to_sydney_time(stop.get("arrivalTimePlanned"))
-                        })
+                for stop in leg.get("stopSequence") or _EMPTY_LEGS:
+                    stop_name = stop.get("disassembledName", "Unknown")
+                    add_stop(FormattedStop(
+                        name=stop_name,
+                        translated_name=translate(stop_name, stop_name),
+                        arrivalTimePlanned=to_sydney(stop.get("arrivalTimePlanned"))
+                    ))
             
-            journeys.append(formatted_journey)
-        
-        logger.debug(f"Response formatting completed. Processed {len(journeys)} journeys.")
-        return {"journeys": journeys} 
\ No newline at end of file
+            yield formatted_journey
\ No newline at end of file
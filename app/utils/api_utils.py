@@ -1,62 +1,69 @@
-import json
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Sequence, Tuple, Union
 import httpx
-from datetime import datetime
-from app.utils.date_utils import SYDNEY_TIMEZONE
+import orjson
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from app.utils.date_utils import SYDNEY_TIMEZONE, parse_iso_datetime
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-async def make_api_request(base_url: str, endpoint: str, headers: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
+# Shared read-only stand-in for a missing origin object
+_EMPTY = MappingProxyType({})
+
+# Layout of TfNSW UTC timestamps, used to compare departure times without parsing them
+_UTC_KEY_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+async def make_api_request(client: httpx.AsyncClient, endpoint: str, params: Union[Dict[str, Any], Sequence[Tuple[str, Any]]]) -> Dict[str, Any]:
     """
     Send request to external API and handle response
     
     Args:
-        base_url: Base URL of the API
-        endpoint: API endpoint
-        headers: Request headers
-        params: Request parameters
+        client: Shared HTTP client configured with the API base URL and headers
+        endpoint: API endpoint, relative to the client's base URL
+        params: Request parameters, as a dict or a sequence of (key, value) pairs
         
     Returns:
         JSON data from API response
     """
-    # Build complete request URL for logging
-    full_url = f"{base_url}/{endpoint}?{httpx.QueryParams(params)}"
-    logger.debug(f"Sending request to API: GET@{full_url}")
-    
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{base_url}/{endpoint}",
-                headers=headers,
-                params=params
-            )
-            
-            if response.status_code == 401:
-                logger.error("Authentication failed. Please check your API key")
-                raise Exception("Authentication failed. Please check your API key")
-            elif response.status_code == 403:
-                logger.error("Access forbidden. Your API key may not have required permissions")
-                raise Exception("Access forbidden. Your API key may not have required permissions")
-            elif response.status_code == 404:
-                logger.error("Resource not found. Please check the requested URL and parameters")
-                raise Exception("Resource not found. Please check the requested URL and parameters")
-            
-            response.raise_for_status()
-            
-            response_data = response.json()
-            logger.debug(f"API response status code: {response.status_code}")
+        response = await client.get(endpoint, params=params)
+        # httpx has already merged the base URL and params, log that URL rather than rebuilding it
+        logger.debug("Sent request to API: GET@%s", response.request.url)
+        
+        if response.status_code == 401:
+            logger.error("Authentication failed. Please check your API key")
+            raise Exception("Authentication failed. Please check your API key")
+        elif response.status_code == 403:
+            logger.error("Access forbidden. Your API key may not have required permissions")
+            raise Exception("Access forbidden. Your API key may not have required permissions")
+        elif response.status_code == 404:
+            logger.error("Resource not found. Please check the requested URL and parameters")
+            raise Exception("Resource not found. Please check the requested URL and parameters")
+        
+        response.raise_for_status()
+        
+        # orjson decodes straight from the raw bytes, skipping httpx's text decode + stdlib json
+        response_data = orjson.loads(response.content)
+        logger.debug("API response status code: %s", response.status_code)
+        
+        return response_data
             
-            return response_data
-                
     except httpx.HTTPError as e:
+        # Connect errors and timeouts never reach the debug log above, so name the URL that failed here
+        try:
+            logger.error("Request to API failed: GET@%s", e.request.url)
+        except RuntimeError:
+            # httpx raises this when the error was created without a request
+            pass
         error_msg = f"HTTP request failed: {str(e)}"
         if hasattr(e, 'response') and e.response is not None:
             error_msg += f"\nResponse status code: {e.response.status_code}"
             try:
-                error_details = e.response.json()
-                error_msg += f"\nError details: {json.dumps(error_details)}"
+                # Re-encode compactly so the logged error stays on one line
+                error_details = orjson.loads(e.response.content)
+                error_msg += f"\nError details: {orjson.dumps(error_details).decode()}"
             except:
                 error_msg += f"\nResponse text: {e.response.text}"
         logger.error(error_msg)
@@ -82,23 +89,29 @@ def filter_journeys_by_time(journeys: list, reference_time: str = None) -> list:
     reference_dt = None
     if reference_time:
         # Parse the input time string
-        reference_dt = datetime.fromisoformat(reference_time)
+        reference_dt = parse_iso_datetime(reference_time)
         # If the datetime is naive (no timezone info), assume it's Sydney time
         if reference_dt.tzinfo is None:
-            reference_dt = SYDNEY_TIMEZONE.localize(reference_dt)
+            reference_dt = reference_dt.replace(tzinfo=SYDNEY_TIMEZONE)
     else:
         reference_dt = datetime.now(SYDNEY_TIMEZONE)
     
-    filtered_journeys = []
-    for journey in journeys:
-        if journey.get("legs"):
-            first_leg = journey["legs"][0]
-            departure_time = first_leg.get("origin", {}).get("departureTimePlanned")
-            if departure_time:
-                journey_dt = datetime.fromisoformat(departure_time.replace('Z', '+00:00'))
-                journey_dt = journey_dt.astimezone(SYDNEY_TIMEZONE)
-                if journey_dt >= reference_dt:
-                    filtered_journeys.append(journey)
+    # TfNSW returns UTC times as 'YYYY-MM-DDTHH:MM:SSZ', which sort lexicographically, so the
+    # reference is rendered once in that layout (rounded up to the second) and compared as a string
+    reference_key = (reference_dt.astimezone(timezone.utc) + timedelta(microseconds=999999)).strftime(_UTC_KEY_FORMAT)
+    
+    def departs_after_reference(departure_time: str) -> bool:
+        if len(departure_time) == 20 and departure_time[-1] == "Z":
+            return departure_time >= reference_key
+        # Any other layout falls back to a full parse
+        return parse_iso_datetime(departure_time) >= reference_dt
+    
+    filtered_journeys = [
+        journey for journey in journeys
+        if (legs := journey.get("legs"))
+        and (departure_time := (legs[0].get("origin") or _EMPTY).get("departureTimePlanned"))
+        and departs_after_reference(departure_time)
+    ]
     
-    logger.debug(f"Number of journeys after filtering: {len(filtered_journeys)}")
+    logger.debug("Number of journeys after filtering: %d", len(filtered_journeys))
     return filtered_journeys 
\ No newline at end of file
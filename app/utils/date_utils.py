@@ -1,7 +1,14 @@
-import pytz
 from datetime import datetime
+from functools import lru_cache
 import logging
+import time
 from typing import Optional, Tuple
+from zoneinfo import ZoneInfo
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # pragma: no cover - fall back to the stdlib parser (handles 'Z' on 3.11+)
+    _parse_iso = datetime.fromisoformat
 
 from app.utils.public_holidays import (
     get_holidays_for_year, 
@@ -12,7 +19,29 @@ from app.utils.public_holidays import (
 logger = logging.getLogger(__name__)
 
 # Set Sydney timezone
-SYDNEY_TIMEZONE = pytz.timezone('Australia/Sydney')
+SYDNEY_TIMEZONE = ZoneInfo('Australia/Sydney')
+
+# strftime formats used for TfNSW request parameters and response times
+_STRF_DATE = "%Y%m%d"
+_STRF_TIME = "%H%M"
+_STRF_FULL = "%Y-%m-%d %H:%M:%S %Z"
+
+# Current Sydney (YYYYMMDD, HHMM), reused until the wall-clock minute changes
+_now_cache = {"minute": None, "date": "", "time": ""}
+
+@lru_cache(maxsize=4096)
+def parse_iso_datetime(time_str: str) -> datetime:
+    """
+    Parse an ISO-8601 time string, accepting a trailing 'Z' for UTC.
+    Results are memoized since TfNSW responses repeat the same stop times across legs.
+    
+    Args:
+        time_str: ISO format time string
+        
+    Returns:
+        Parsed datetime (timezone-aware if the string carries an offset)
+    """
+    return _parse_iso(time_str)
 
 def format_time(time_str: Optional[str]) -> Tuple[str, str]:
     """
@@ -25,18 +54,22 @@ def format_time(time_str: Optional[str]) -> Tuple[str, str]:
         Tuple containing formatted date and time (YYYYMMDD, HHMM)
     """
     if not time_str:
-        now = datetime.now(SYDNEY_TIMEZONE)
-        return now.strftime("%Y%m%d"), now.strftime("%H%M")
+        # Sydney's UTC offset is a whole number of minutes, so HHMM only changes with the epoch minute
+        minute = int(time.time() // 60)
+        if _now_cache["minute"] != minute:
+            now = datetime.fromtimestamp(minute * 60, SYDNEY_TIMEZONE)
+            _now_cache.update(minute=minute, date=now.strftime(_STRF_DATE), time=now.strftime(_STRF_TIME))
+        return _now_cache["date"], _now_cache["time"]
     
     try:
         # Parse the input time string
-        dt = datetime.fromisoformat(time_str)
+        dt = parse_iso_datetime(time_str)
         # If the datetime is naive (no timezone info), assume it's Sydney time
         if dt.tzinfo is None:
-            dt = SYDNEY_TIMEZONE.localize(dt)
+            dt = dt.replace(tzinfo=SYDNEY_TIMEZONE)
         # Convert to Sydney time if it's in a different timezone
         sydney_dt = dt.astimezone(SYDNEY_TIMEZONE)
-        return sydney_dt.strftime("%Y%m%d"), sydney_dt.strftime("%H%M")
+        return sydney_dt.strftime(_STRF_DATE), sydney_dt.strftime(_STRF_TIME)
     except ValueError as e:
         raise ValueError(f"Invalid time format. Expected ISO format (e.g., 2024-01-20T09:00:00): {e}")
 
@@ -54,15 +87,20 @@ def convert_to_sydney_time(time_str: str) -> str:
         return time_str
     
     try:
-        # Parse time string (assuming UTC input)
-        dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-        # Convert to Sydney time
-        sydney_time = dt.astimezone(SYDNEY_TIMEZONE)
-        # Return formatted time string
-        return sydney_time.strftime("%Y-%m-%d %H:%M:%S %Z")
+        return _to_sydney_str(time_str)
     except (ValueError, TypeError):
         return time_str
 
+@lru_cache(maxsize=4096)
+def _to_sydney_str(time_str: str) -> str:
+    """Parse a UTC time string and format it in Sydney time (memoized per input string)"""
+    # Parse time string (assuming UTC input)
+    dt = parse_iso_datetime(time_str)
+    # Convert to Sydney time
+    sydney_time = dt.astimezone(SYDNEY_TIMEZONE)
+    # Return formatted time string
+    return sydney_time.strftime(_STRF_FULL)
+
 def is_public_holiday(dt: datetime) -> bool:
     """
     Check if the given date is a public holiday in NSW
@@ -82,12 +120,34 @@ def is_public_holiday(dt: datetime) -> bool:
     
     # Check if date is in holidays
     if date_str in holidays.values():
-        logger.debug(f"Date {date_str} is a public holiday in {year}")
+        logger.debug("Date %s is a public holiday in %s", date_str, year)
         return True
     
-    logger.debug(f"Date {date_str} is not a public holiday")
+    logger.debug("Date %s is not a public holiday", date_str)
     return False
 
+def _is_off_peak_slot(weekday: int, slot: int) -> bool:
+    """
+    Check if a half-hour slot is off-peak, ignoring public holidays
+    
+    Args:
+        weekday: Day of week, Monday is 0 and Sunday is 6
+        slot: Half-hour slot of the day, 0 is 00:00-00:30 and 47 is 23:30-24:00
+        
+    Returns:
+        True if the slot is off-peak, False if it's peak time
+    """
+    # Friday and weekends (Saturday = 5, Sunday = 6) are all off-peak
+    if weekday >= 4:
+        return True
+    # Monday to Thursday peaks: morning 6:30 AM to 10:00 AM, evening 3:00 PM to 7:00 PM
+    return not (13 <= slot < 20 or 30 <= slot < 38)
+
+# Every peak boundary falls on a half hour, so off-peak is a lookup of (weekday, half-hour slot)
+_OFF_PEAK_SLOTS = frozenset(
+    (weekday, slot) for weekday in range(7) for slot in range(48) if _is_off_peak_slot(weekday, slot)
+)
+
 def is_off_peak_time(dt: datetime) -> bool:
     """
     Check if the given time is during off-peak hours in Sydney
@@ -108,34 +168,10 @@ def is_off_peak_time(dt: datetime) -> bool:
     """
     # First check if it's a public holiday
     if is_public_holiday(dt):
-        logger.debug(f"Date {dt.strftime('%Y-%m-%d')} is a public holiday - off-peak applies")
+        logger.debug("Date %s is a public holiday - off-peak applies", dt.date())
         return True
-        
-    weekday = dt.weekday()  # Monday is 0, Sunday is 6
-    hour = dt.hour
-    minute = dt.minute
     
-    # Weekend (Saturday = 5, Sunday = 6)
-    if weekday >= 5:
-        logger.debug(f"Day is weekend (weekday={weekday}) - off-peak applies")
-        return True
-        
-    # Friday is all off-peak
-    if weekday == 4:  # Friday
-        logger.debug(f"Day is Friday - off-peak applies")
-        return True
-        
-    # Monday to Thursday peak times
-    # Morning peak: 6:30 AM to 10:00 AM
-    if (hour == 6 and minute >= 30) or (hour > 6 and hour < 10):
-        logger.debug(f"Time {hour}:{minute:02d} is during morning peak (6:30-10:00) on weekday {weekday}")
-        return False
-        
-    # Evening peak: 3:00 PM to 7:00 PM
-    if hour >= 15 and hour < 19:
-        logger.debug(f"Time {hour}:{minute:02d} is during evening peak (15:00-19:00) on weekday {weekday}")
-        return False
-        
-    # All other times are off-peak
-    logger.debug(f"Time {hour}:{minute:02d} on weekday {weekday} is outside peak hours - off-peak applies")
-    return True 
\ No newline at end of file
+    weekday = dt.weekday()  # Monday is 0, Sunday is 6
+    off_peak = (weekday, dt.hour * 2 + dt.minute // 30) in _OFF_PEAK_SLOTS
+    logger.debug("Time %d:%02d on weekday %d is %s", dt.hour, dt.minute, weekday, "off-peak" if off_peak else "peak")
+    return off_peak 
\ No newline at end of file
@@ -1,5 +1,7 @@
 import pandas as pd
+import hashlib
 import json
+import msgpack
 from pathlib import Path
 
 def generate_distance_map():
@@ -37,8 +39,15 @@ def generate_distance_map():
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Save as JSON file
-    with open(output_dir / 'distance_map.json', 'w', encoding='utf-8') as f:
-        json.dump(distance_map, f, indent=2, ensure_ascii=False)
+    json_bytes = json.dumps(distance_map, indent=2, ensure_ascii=False).encode('utf-8')
+    with open(output_dir / 'distance_map.json', 'wb') as f:
+        f.write(json_bytes)
+    
+    # Save a msgpack copy, which the fare service loads in preference to the JSON
+    # as long as the recorded hash still matches the JSON file
+    build = {"source_sha256": hashlib.sha256(json_bytes).hexdigest(), "distances": distance_map}
+    with open(output_dir / 'distance_map.msgpack', 'wb') as f:
+        f.write(msgpack.packb(build, use_bin_type=True))
         
     print(f"Generated distance map with {len(distance_map)} entries")
 